@@ -1,7 +1,15 @@
 import json
 
+import copy
+
+import functools
+
 import hashlib
 
+import io
+
+import itertools
+
 import os
 
 import re
@@ -10,15 +18,39 @@ import sys
 
 import time
 
+import weakref
+
 import tkinter as tk
 
+from collections import deque
+
+from contextlib import contextmanager
+
 from dataclasses import dataclass
 
 from tkinter import colorchooser, filedialog, messagebox, simpledialog, ttk
 
 import tkinter.font as tkfont
 
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+
+try:
+
+    import jsonpatch  # optional: delta-compressed undo snapshots
+
+except Exception:
+
+    jsonpatch = None
+
+try:
+
+    import orjson  # optional: fast JSON serialization for project files
+
+except Exception:
+
+    orjson = None
 
 
 
@@ -812,6 +844,12 @@ class SpellCheckManager:
 
 
 
+        self._text_bindtag = "SpellcheckedText"
+
+        self._text_bindtag_ready = False
+
+
+
         try:
 
             ttk.Style(self.root).configure(
@@ -910,6 +948,26 @@ class SpellCheckManager:
 
 
 
+    def _ensure_text_bindtag(self) -> None:
+
+        if self._text_bindtag_ready:
+
+            return
+
+        tag = self._text_bindtag
+
+        self.root.bind_class(tag, "<<Modified>>", lambda e: self._schedule_text_check(e.widget))
+
+        self.root.bind_class(tag, "<KeyRelease>", lambda e: self._schedule_text_check(e.widget))
+
+        self.root.bind_class(tag, "<ButtonRelease-1>", lambda e: self._schedule_text_check(e.widget))
+
+        self.root.bind_class(tag, "<Button-3>", lambda e: self._on_text_right_click(e, e.widget))
+
+        self._text_bindtag_ready = True
+
+
+
     def register_text(self, text: tk.Text) -> None:
 
         key = str(text)
@@ -938,13 +996,9 @@ class SpellCheckManager:
 
 
 
-        text.bind("<<Modified>>", lambda _e, w=text: self._schedule_text_check(w), add="+")
-
-        text.bind("<KeyRelease>", lambda _e, w=text: self._schedule_text_check(w), add="+")
+        self._ensure_text_bindtag()
 
-        text.bind("<ButtonRelease-1>", lambda _e, w=text: self._schedule_text_check(w), add="+")
-
-        text.bind("<Button-3>", lambda e, w=text: self._on_text_right_click(e, w), add="+")
+        text.bindtags(text.bindtags() + (self._text_bindtag,))
 
 
 
@@ -2658,39 +2712,71 @@ def _ask_string_centered(
 
 
 
-def apply_modern_theme(root: tk.Tk) -> None:
+# Theme candidates per windowing system and the font-independent style
 
-    style = ttk.Style(root)
+# settings, built once at import instead of on each apply.
 
-    try:
+_THEME_PREFERENCES: Dict[str, Tuple[str, ...]] = {
 
-        windowing = root.tk.call("tk", "windowingsystem")
+    "win32": ("vista", "xpnative"),
 
-    except Exception:
+    "aqua": ("aqua",),
 
-        windowing = ""
+}
 
+_DEFAULT_THEME_PREFERENCE: Tuple[str, ...] = ("clam", "alt")
 
 
-    preferred: List[str] = []
 
-    if windowing == "win32":
+_STATIC_STYLE_TABLE: Tuple[Tuple[str, Dict[str, Any]], ...] = (
 
-        preferred = ["vista", "xpnative"]
+    ("TButton", {"padding": (10, 6)}),
 
-    elif windowing == "aqua":
+    ("TEntry", {"padding": (6, 4)}),
 
-        preferred = ["aqua"]
+    ("TCombobox", {"padding": (6, 4)}),
 
-    else:
+)
+
+
+
+
+
+_theme_applied_roots: "weakref.WeakSet" = weakref.WeakSet()
+
+
+
+
+
+def apply_modern_theme(root: tk.Tk) -> None:
+
+    # Styles are per-interpreter; applying once per root is enough and
+
+    # skips the font/theme Tcl queries on repeat calls.
+
+    if root in _theme_applied_roots:
+
+        return
+
+    _theme_applied_roots.add(root)
+
+    style = ttk.Style(root)
+
+    try:
+
+        windowing = root.tk.call("tk", "windowingsystem")
+
+    except Exception:
+
+        windowing = ""
 
-        preferred = ["clam", "alt"]
 
 
+    available = set(style.theme_names())
 
-    for theme in preferred:
+    for theme in _THEME_PREFERENCES.get(windowing, _DEFAULT_THEME_PREFERENCE):
 
-        if theme in style.theme_names():
+        if theme in available:
 
             style.theme_use(theme)
 
@@ -2706,15 +2792,15 @@ def apply_modern_theme(root: tk.Tk) -> None:
 
         base_size = int(default_font.cget("size"))
 
-        style.configure("TButton", padding=(10, 6))
+        for name, cfg in _STATIC_STYLE_TABLE:
 
-        style.configure("TEntry", padding=(6, 4))
+            style.configure(name, **cfg)
 
-        style.configure("TCombobox", padding=(6, 4))
+        bold_font = (base_family, base_size, "bold")
 
-        style.configure("TLabelframe.Label", font=(base_family, base_size, "bold"))
+        style.configure("TLabelframe.Label", font=bold_font)
 
-        style.configure("Heading.Treeview", font=(base_family, base_size, "bold"))
+        style.configure("Heading.Treeview", font=bold_font)
 
         style.configure("Treeview", rowheight=max(24, base_size + 12))
 
@@ -3390,535 +3476,1007 @@ def _export_file_path() -> str:
 
 def deep_copy(obj):
 
-    return json.loads(json.dumps(obj))
+    # copy.deepcopy avoids the serialize/reparse round-trip; all document
 
+    # data is plain dict/list/str/number, so the result is identical.
 
+    return copy.deepcopy(obj)
 
 
 
-_LATEX_ESCAPE_REPLACEMENTS = {
 
-    "\\": r"\textbackslash{}",
 
-    "{": r"\{",
+def _var_text(var: Optional[tk.Variable]) -> str:
 
-    "}": r"\}",
+    return "" if var is None else str(var.get() or "")
 
-    "&": r"\&",
 
-    "%": r"\%",
 
-    "$": r"\$",
 
-    "#": r"\#",
 
-    "_": r"\_",
+_BULLET_PREFIX_RE = re.compile(r"^[\-–—•*]\s+")
 
-    "~": r"\textasciitilde{}",
 
-    "^": r"\textasciicircum{}",
 
-}
 
 
+_HEX6_RE = re.compile(r"#?[0-9a-fA-F]{6}")
 
 
 
-def latex_escape(s: str) -> str:
 
-    return "".join(_LATEX_ESCAPE_REPLACEMENTS.get(ch, ch) for ch in s)
 
+@functools.lru_cache(maxsize=512)
 
+def _parse_font_tag(tag: str) -> Optional[Tuple[str, int, bool, bool, bool]]:
 
+    # Tag names repeat heavily across runs, so each distinct name is parsed
 
+    # once and served from the cache afterwards. The format is the fixed
 
-def _normalize_href(url: str) -> str:
+    # "f:family|s:size|b:0|i:0|u:0" produced by _font_key_tag, so a split
 
-    u = ("" if url is None else str(url)).strip()
+    # beats a regex state machine here.
 
-    if not u:
+    parts = tag.split("|")
 
-        return ""
+    if (
 
-    try:
+        len(parts) != 5
 
-        if re.match(r"^[a-zA-Z][a-zA-Z0-9+.\-]*:", u):
+        or not parts[0].startswith("f:")
 
-            return u
+        or not parts[1].startswith("s:")
 
-    except Exception:
+        or not parts[1][2:].isdigit()
 
-        return u
+        or not parts[2].startswith("b:")
 
-    return "https://" + u
+        or not parts[3].startswith("i:")
 
+        or not parts[4].startswith("u:")
 
+    ):
 
+        return None
 
+    return (
 
-def _hex_to_rgb_floats(hex_color: str) -> Optional[Tuple[float, float, float]]:
+        parts[0][2:],
 
-    m = re.fullmatch(r"#?([0-9a-fA-F]{6})", hex_color or "")
+        int(parts[1][2:]),
 
-    if not m:
+        parts[2][2:] == "1",
 
-        return None
+        parts[3][2:] == "1",
 
-    v = m.group(1)
+        parts[4][2:] == "1",
 
-    r = int(v[0:2], 16) / 255.0
+    )
 
-    g = int(v[2:4], 16) / 255.0
 
-    b = int(v[4:6], 16) / 255.0
 
-    return (r, g, b)
 
 
+def _norm_hex_color(c: Any) -> Optional[str]:
 
+    s = ("" if c is None else str(c)).strip()
 
+    if not s:
 
-def rich_segments_to_latex(segments) -> str:
+        return None
 
-    out_parts: List[str] = []
+    if _HEX6_RE.fullmatch(s):
 
-    for seg in segments or []:
+        return ("#" + s.lstrip("#")).lower()
 
-        raw_text = seg.get("text", "")
+    return None
 
-        if raw_text == "":
 
-            continue
 
-        t = latex_escape(raw_text)
 
-        if seg.get("i"):
 
-            t = rf"\emph{{{t}}}"
+_FONT_MAP = {
 
-        if seg.get("u"):
+    "courier": "Courier New",
 
-            t = rf"\underline{{{t}}}"
+    "mono": "Courier New",
 
-        if seg.get("b"):
+    "arial": "Arial",
 
-            t = rf"\textbf{{{t}}}"
+    "helvetica": "Arial",
 
+    "sans": "Arial",
 
+    "times": "Times New Roman",
 
-        fg = seg.get("fg")
+    "serif": "Times New Roman",
 
-        bg = seg.get("bg")
+    "georgia": "Times New Roman",
 
+}
 
 
-        fg_rgb = _hex_to_rgb_floats(fg) if fg else None
 
-        bg_rgb = _hex_to_rgb_floats(bg) if bg else None
 
 
+@functools.lru_cache(maxsize=64)
 
-        if fg_rgb is not None:
+def _map_docx_font_cached(f: str) -> str:
 
-            t = rf"\textcolor[rgb]{{{fg_rgb[0]:.3f},{fg_rgb[1]:.3f},{fg_rgb[2]:.3f}}}{{{t}}}"
+    for key, mapped in _FONT_MAP.items():
 
-        if bg_rgb is not None:
+        if key in f:
 
-            t = rf"\colorbox[rgb]{{{bg_rgb[0]:.3f},{bg_rgb[1]:.3f},{bg_rgb[2]:.3f}}}{{{t}}}"
+            return mapped
 
+    return "Times New Roman"
 
 
-        size = seg.get("size")
 
-        if size is not None:
 
-            try:
 
-                s_int = int(size)
+def _map_docx_font(face: Any) -> str:
 
-            except Exception:
+    return _map_docx_font_cached(("" if face is None else str(face)).strip().lower())
 
-                s_int = 0
 
-            if s_int > 0:
 
-                baseline = max(int(round(s_int * 1.2)), s_int + 1)
 
-                t = rf"{{\fontsize{{{s_int}}}{{{baseline}}}\selectfont {t}}}"
 
+_LATEX_ESCAPE_REPLACEMENTS = {
 
+    "\\": r"\textbackslash{}",
 
-        out_parts.append(t)
+    "{": r"\{",
 
-    return "".join(out_parts)
+    "}": r"\}",
 
+    "&": r"\&",
 
+    "%": r"\%",
 
+    "$": r"\$",
 
+    "#": r"\#",
 
-def load_resume_data() -> dict:
+    "_": r"\_",
 
-    path = _data_file_path()
+    "~": r"\textasciitilde{}",
 
-    if not os.path.exists(path):
+    "^": r"\textasciicircum{}",
 
-        return deep_copy(DEFAULT_DATA)
+}
 
-    try:
 
-        with open(path, "r", encoding="utf-8") as f:
 
-            return json.load(f)
 
-    except Exception:
 
-        return deep_copy(DEFAULT_DATA)
+_LATEX_TRANS = str.maketrans(_LATEX_ESCAPE_REPLACEMENTS)
 
 
 
+# Derived from the replacement table so the two cannot drift apart.
 
+_LATEX_SPECIALS_RE = re.compile("[" + re.escape("".join(_LATEX_ESCAPE_REPLACEMENTS)) + "]")
 
-def save_resume_data(data: dict) -> None:
 
-    path = _data_file_path()
 
-    with open(path, "w", encoding="utf-8") as f:
 
-        json.dump(data, f, indent=2, ensure_ascii=False)
 
+@functools.lru_cache(maxsize=512)
 
+def latex_escape(s: str) -> str:
 
+    # Repeated strings (locations, section titles, dates) escape once per
 
+    # cache lifetime. Most fields (names, dates, locations) have no
 
-def generate_latex(data: dict) -> str:
+    # specials; skip the translate pass entirely for them.
 
-    header = data.get("header", {})
+    if not _LATEX_SPECIALS_RE.search(s):
 
-    name = latex_escape(header.get("name", ""))
+        return s
 
-    phone = latex_escape(header.get("phone", ""))
+    return s.translate(_LATEX_TRANS)
 
-    email = header.get("email", "")
 
-    linkedin_kind = str(header.get("linkedin_kind", "LinkedIn") or "").strip()
 
-    linkedin = "" if linkedin_kind.lower() == "none" else header.get("linkedin", "")
 
-    linkedin_display_override = header.get("linkedin_display", "")
 
-    github_kind = str(header.get("github_kind", "GitHub") or "").strip()
+def _normalize_href(url: str) -> str:
 
-    github = "" if github_kind.lower() == "none" else header.get("github", "")
+    u = ("" if url is None else str(url)).strip()
 
-    github_display_override = header.get("github_display", "")
+    if not u:
 
+        return ""
 
+    try:
 
-    email_display = latex_escape(email)
+        if re.match(r"^[a-zA-Z][a-zA-Z0-9+.\-]*:", u):
 
-    email_link = latex_escape(email)
+            return u
 
+    except Exception:
 
+        return u
 
-    linkedin = _normalize_href(linkedin)
+    return "https://" + u
 
-    github = _normalize_href(github)
 
 
 
-    linkedin_display = latex_escape(
 
-        (linkedin_display_override or linkedin.replace("https://", "").replace("http://", ""))
+@functools.lru_cache(maxsize=256)
 
-    )
+def _hex_to_rgb_floats(hex_color: str) -> Optional[Tuple[float, float, float]]:
 
-    github_display = latex_escape(
+    m = _HEX6_RE.fullmatch(hex_color or "")
 
-        (github_display_override or github.replace("https://", "").replace("http://", ""))
+    if not m:
 
-    )
+        return None
 
+    v = m.group(0).lstrip("#")
 
+    r = int(v[0:2], 16) / 255.0
 
-    parts: List[str] = [LATEX_PREAMBLE]
+    g = int(v[2:4], 16) / 255.0
 
+    b = int(v[4:6], 16) / 255.0
 
+    return (r, g, b)
 
-    contact_parts: List[str] = []
 
-    if phone:
 
-        contact_parts.append(phone)
 
-    if email:
 
-        contact_parts.append(rf"\href{{mailto:{email_link}}}{{\underline{{{email_display}}}}}")
+def rich_segments_to_latex(segments) -> str:
 
-    if linkedin:
+    # Pure-Python hot loop for exports; locals are bound outside the loop
 
-        contact_parts.append(
+    # and the common plain-text segment takes the shortest path.
 
-            rf"\href{{{latex_escape(linkedin)}}}{{\underline{{{linkedin_display}}}}}"
+    out_parts: List[str] = []
 
-        )
+    append = out_parts.append
 
-    if github:
+    escape = latex_escape
 
-        contact_parts.append(rf"\href{{{latex_escape(github)}}}{{\underline{{{github_display}}}}}")
+    to_rgb = _hex_to_rgb_floats
 
+    for seg in segments or []:
 
+        get = seg.get
 
-    contact_line = " $|$ ".join(contact_parts)
+        raw_text = get("text", "")
 
-    if contact_line:
+        if raw_text == "":
 
-        contact_line = "    \\small " + contact_line
+            continue
 
-    else:
+        t = escape(raw_text)
 
-        contact_line = "    \\small"
+        if get("i"):
 
+            t = rf"\emph{{{t}}}"
 
+        if get("u"):
 
-    parts.append(
+            t = rf"\underline{{{t}}}"
 
-        "\n".join(
+        if get("b"):
 
-            [
+            t = rf"\textbf{{{t}}}"
 
-                "\\begin{center}",
 
-                f"    \\textbf{{\\Huge \\scshape {name}}} \\\\ \\vspace{{1pt}}",
 
-                contact_line,
+        fg = get("fg")
 
-                "\\end{center}",
+        if fg:
 
-                "",
+            fg_rgb = to_rgb(fg)
 
-            ]
+            if fg_rgb is not None:
 
-        )
+                t = rf"\textcolor[rgb]{{{fg_rgb[0]:.3f},{fg_rgb[1]:.3f},{fg_rgb[2]:.3f}}}{{{t}}}"
 
-    )
+        bg = get("bg")
 
+        if bg:
 
+            bg_rgb = to_rgb(bg)
 
-    for section in data.get("sections", []):
+            if bg_rgb is not None:
 
-        title = latex_escape(section.get("title", ""))
+                t = rf"\colorbox[rgb]{{{bg_rgb[0]:.3f},{bg_rgb[1]:.3f},{bg_rgb[2]:.3f}}}{{{t}}}"
 
-        kind = section.get("kind")
 
-        entries = section.get("entries", [])
 
+        size = get("size")
 
+        if size is not None:
 
-        parts.append(f"\\section{{{title}}}")
+            try:
 
+                s_int = int(size)
 
+            except Exception:
 
-        if kind in ("education", "experience", "projects"):
+                s_int = 0
 
-            parts.append("  \\resumeSubHeadingListStart")
+            if s_int > 0:
 
+                baseline = max(int(round(s_int * 1.2)), s_int + 1)
 
+                t = rf"{{\fontsize{{{s_int}}}{{{baseline}}}\selectfont {t}}}"
 
-        if kind == "education":
 
-            for e in entries:
 
-                parts.append("    \\resumeSubheading")
+        append(t)
 
-                parts.append(
+    return "".join(out_parts)
 
-                    "      "
 
-                    + rf"{{{latex_escape(e.get('school',''))}}}"
 
-                    + rf"{{{latex_escape(e.get('location',''))}}}"
 
-                )
 
-                parts.append(
+def load_resume_data() -> dict:
 
-                    "      "
+    path = _data_file_path()
 
-                    + rf"{{{latex_escape(e.get('degree',''))}}}"
+    if not os.path.exists(path):
 
-                    + rf"{{{latex_escape(e.get('dates',''))}}}"
+        return deep_copy(DEFAULT_DATA)
 
-                )
+    try:
 
+        return _read_json_file(path)
 
+    except Exception:
 
-                body = e.get("body", [])
+        return deep_copy(DEFAULT_DATA)
 
-                if body:
 
-                    parts.append("      \\resumeItemListStart")
 
-                    parts.append("        " + rf"\resumeItem{{{rich_segments_to_latex(body)}}}")
 
-                    parts.append("      \\resumeItemListEnd")
 
-            parts.append("  \\resumeSubHeadingListEnd")
+def _write_file_atomic(path: str, data: bytes) -> None:
 
-            parts.append("")
+    tmp = path + ".tmp"
 
-            continue
+    with open(tmp, "wb") as f:
 
+        f.write(data)
 
+    os.replace(tmp, path)
 
-        if kind == "experience":
 
-            for e in entries:
 
-                parts.append("    \\resumeSubheading")
 
-                parts.append(
 
-                    "      "
+def _write_json_file(path: str, payload: dict) -> None:
 
-                    + rf"{{{latex_escape(e.get('role',''))}}}"
+    if orjson is not None:
 
-                    + rf"{{{latex_escape(e.get('dates',''))}}}"
+        _write_file_atomic(path, orjson.dumps(payload, option=orjson.OPT_INDENT_2))
 
-                )
+        return
 
-                parts.append(
+    _write_file_atomic(path, json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8"))
 
-                    "      "
 
-                    + rf"{{{latex_escape(e.get('org',''))}}}"
 
-                    + rf"{{{latex_escape(e.get('location',''))}}}"
 
-                )
 
+def _read_json_file(path: str) -> Any:
 
+    with open(path, "rb") as f:
 
-                bullets = e.get("bullets", [])
+        buf = f.read()
 
-                if bullets:
+    if orjson is not None:
 
-                    parts.append("      \\resumeItemListStart")
+        return orjson.loads(buf)
 
-                    for b in bullets:
+    return json.loads(buf)
 
-                        parts.append(
 
-                            "        " + rf"\resumeItem{{{rich_segments_to_latex(b)}}}"
 
-                        )
 
-                    parts.append("      \\resumeItemListEnd")
 
-                    parts.append("")
+@functools.lru_cache(maxsize=2048)
 
-            parts.append("  \\resumeSubHeadingListEnd")
+def _cached_string_width(text: str, font: str, size: float) -> float:
 
-            parts.append("")
+    # Resume rows repeat the same short strings (dates, locations); caching
 
-            continue
+    # avoids re-walking ReportLab's glyph metrics for each occurrence.
 
+    from reportlab.pdfbase.pdfmetrics import stringWidth
 
+    return stringWidth(text, font, size)
 
-        if kind == "projects":
 
-            for e in entries:
 
-                title_text = latex_escape(e.get("title", ""))
 
-                stack_text = latex_escape(e.get("stack", ""))
 
-                dates_text = latex_escape(e.get("dates", ""))
+_PDF_FACE_TABLE = {
 
-                left = rf"\textbf{{{title_text}}} $|$ \emph{{{stack_text}}}"
+    "courier": "Courier",
 
-                parts.append("      \\resumeProjectHeading")
+    "mono": "Courier",
 
-                parts.append("          " + rf"{{{left}}}{{{dates_text}}}")
+    "arial": "Helvetica",
 
+    "helvetica": "Helvetica",
 
+    "sans": "Helvetica",
 
-                bullets = e.get("bullets", [])
+    "times": "Times-Roman",
 
-                if bullets:
+    "serif": "Times-Roman",
 
-                    parts.append("          \\resumeItemListStart")
+    "georgia": "Times-Roman",
 
-                    for b in bullets:
+}
 
-                        parts.append(
 
-                            "            "
 
-                            + rf"\resumeItem{{{rich_segments_to_latex(b)}}}"
 
-                        )
 
-                    parts.append("          \\resumeItemListEnd")
+# Common typographic characters worth fixing up before the cp1252 pass.
 
-            parts.append("    \\resumeSubHeadingListEnd")
+_SANITIZE_TRANSLATE = str.maketrans(
 
-            parts.append("")
+    {
 
-            continue
+        "“": '"',
 
+        "”": '"',
 
+        "‘": "'",
 
-        if kind == "skills":
+        "’": "'",
 
-            parts.append(" \\begin{itemize}[leftmargin=0.15in, label={}]")
+    }
 
-            parts.append("    \\small{\\item{")
+)
 
-            for idx, e in enumerate(entries):
 
-                label = latex_escape(e.get("label", ""))
 
-                value = rich_segments_to_latex(e.get("value", []))
 
-                line = rf"     \textbf{{{label}}}{{: {value}}}"
 
-                if idx != len(entries) - 1:
+@functools.lru_cache(maxsize=256)
 
-                    line += r" \\\\"
+def _sanitize_text(t: Any) -> str:
 
-                parts.append(line)
+    if t is None:
 
-            parts.append("    }}")
+        return ""
 
-            parts.append(" \\end{itemize}")
+    s = t if isinstance(t, str) else str(t)
 
-            parts.append("")
+    if s.isascii():
 
-            continue
+        return s
+
+    try:
+
+        return s.translate(_SANITIZE_TRANSLATE).encode("cp1252", errors="replace").decode("cp1252")
+
+    except Exception:
+
+        return s
+
+
+
+
+
+def _nbsp(s: str) -> str:
+
+    return (s or "").replace(" ", "\u00A0")
+
+
+
+
+
+def _s(x: Any) -> str:
+
+    if isinstance(x, str):
+
+        return x.strip()
+
+    return "" if x is None else str(x).strip()
+
+
+
+
+
+@functools.lru_cache(maxsize=64)
+
+def _map_font_face(face: Any) -> str:
+
+    f = ("" if face is None else str(face)).strip().lower()
+
+    if not f:
+
+        return "Times-Roman"
+
+    return next((v for k, v in _PDF_FACE_TABLE.items() if k in f), "Times-Roman")
+
+
+
+
+
+@functools.lru_cache(maxsize=32)
+
+def _font_face_attr(mapped: str) -> str:
+
+    return f' face="{mapped}"'
+
+
+
+
+
+@functools.lru_cache(maxsize=64)
+
+def _map_font_variant(base: str, *, bold: bool, italic: bool) -> str:
+
+    b = bool(bold)
+
+    i = bool(italic)
+
+    if base.startswith("Times"):
+
+        if b and i:
+
+            return "Times-BoldItalic"
+
+        if b:
+
+            return "Times-Bold"
+
+        if i:
 
+            return "Times-Italic"
 
+        return "Times-Roman"
 
-        for e in entries:
+    if base.startswith("Helvetica"):
 
-            title_text = latex_escape(e.get("title", ""))
+        if b and i:
 
-            body_segments = e.get("body", [])
+            return "Helvetica-BoldOblique"
 
-            if title_text:
+        if b:
 
-                parts.append(rf"\textbf{{{title_text}}}\\")
+            return "Helvetica-Bold"
 
-            if body_segments:
+        if i:
 
-                parts.append(rich_segments_to_latex(body_segments) + r"\\")
+            return "Helvetica-Oblique"
 
-            parts.append("")
+        return "Helvetica"
 
+    if base.startswith("Courier"):
 
+        if b and i:
 
-    parts.append(LATEX_END)
+            return "Courier-BoldOblique"
 
-    return "\n".join(parts)
+        if b:
+
+            return "Courier-Bold"
+
+        if i:
+
+            return "Courier-Oblique"
+
+        return "Courier"
+
+    return base
+
+
+
+
+
+@functools.lru_cache(maxsize=256)
+
+def _normalize_color(c: Any) -> Optional[str]:
+
+    s = ("" if c is None else str(c)).strip()
+
+    if not s:
+
+        return None
+
+    if s.startswith("#") and len(s) == 7 or _HEX6_RE.fullmatch(s):
+
+        return ("#" + s.lstrip("#")).lower()
+
+    return s
+
+
+
+
+
+def _to_rl_color(c: Any):
+
+    s = _normalize_color(c)
+
+    if not s:
+
+        return None
+
+    from reportlab.lib import colors
+
+    try:
+
+        return colors.toColor(s)
+
+    except Exception:
+
+        try:
+
+            if s.startswith("#") and len(s) == 7:
+
+                return colors.HexColor(s)
+
+        except Exception:
+
+            pass
+
+    return None
+
+
+
+
+
+def save_resume_data(data: dict) -> None:
+
+    _write_json_file(_data_file_path(), data)
+
+
+
+
+
+def _iter_latex_lines(data: dict) -> Iterator[str]:
+
+    header = data.get("header", {})
+
+    name = latex_escape(header.get("name", ""))
+
+    phone = latex_escape(header.get("phone", ""))
+
+    email = header.get("email", "")
+
+    linkedin_kind = str(header.get("linkedin_kind", "LinkedIn") or "").strip()
+
+    linkedin = "" if linkedin_kind.lower() == "none" else header.get("linkedin", "")
+
+    linkedin_display_override = header.get("linkedin_display", "")
+
+    github_kind = str(header.get("github_kind", "GitHub") or "").strip()
+
+    github = "" if github_kind.lower() == "none" else header.get("github", "")
+
+    github_display_override = header.get("github_display", "")
+
+
+
+    email_display = latex_escape(email)
+
+    email_link = latex_escape(email)
+
+
+
+    linkedin = _normalize_href(linkedin)
+
+    github = _normalize_href(github)
+
+
+
+    linkedin_display = latex_escape(
+
+        (linkedin_display_override or linkedin.replace("https://", "").replace("http://", ""))
+
+    )
+
+    github_display = latex_escape(
+
+        (github_display_override or github.replace("https://", "").replace("http://", ""))
+
+    )
+
+
+
+    yield LATEX_PREAMBLE
+
+
+
+    contact_parts: List[str] = []
+
+    if phone:
+
+        contact_parts.append(phone)
+
+    if email:
+
+        contact_parts.append(rf"\href{{mailto:{email_link}}}{{\underline{{{email_display}}}}}")
+
+    if linkedin:
+
+        contact_parts.append(
+
+            rf"\href{{{latex_escape(linkedin)}}}{{\underline{{{linkedin_display}}}}}"
+
+        )
+
+    if github:
+
+        contact_parts.append(rf"\href{{{latex_escape(github)}}}{{\underline{{{github_display}}}}}")
+
+
+
+    contact_line = " $|$ ".join(contact_parts)
+
+    if contact_line:
+
+        contact_line = "    \\small " + contact_line
+
+    else:
+
+        contact_line = "    \\small"
+
+
+
+    yield (
+
+        "\n".join(
+
+            [
+
+                "\\begin{center}",
+
+                f"    \\textbf{{\\Huge \\scshape {name}}} \\\\ \\vspace{{1pt}}",
+
+                contact_line,
+
+                "\\end{center}",
+
+                "",
+
+            ]
+
+        )
+
+    )
+
+
+
+    get_renderer = _LATEX_SECTION_RENDERERS.get
+
+    for section in data.get("sections", []):
+
+        title = latex_escape(section.get("title", ""))
+
+        entries = section.get("entries", [])
+
+
+
+        yield (f"\\section{{{title}}}")
+
+
+
+        yield from get_renderer(section.get("kind"), _latex_custom_lines)(entries)
+
+
+
+    yield LATEX_END
+
+
+
+
+
+def _latex_education_lines(entries: list) -> Iterator[str]:
+
+    yield "  \\resumeSubHeadingListStart"
+
+    for e in entries:
+
+        yield "    \\resumeSubheading"
+
+        yield rf"      {{{latex_escape(e.get('school',''))}}}{{{latex_escape(e.get('location',''))}}}"
+
+        yield rf"      {{{latex_escape(e.get('degree',''))}}}{{{latex_escape(e.get('dates',''))}}}"
+
+
+
+        body = e.get("body", [])
+
+        if body:
+
+            yield "      \\resumeItemListStart"
+
+            yield rf"        \resumeItem{{{rich_segments_to_latex(body)}}}"
+
+            yield "      \\resumeItemListEnd"
+
+    yield "  \\resumeSubHeadingListEnd"
+
+    yield ""
+
+
+
+
+
+def _latex_experience_lines(entries: list) -> Iterator[str]:
+
+    yield "  \\resumeSubHeadingListStart"
+
+    for e in entries:
+
+        yield "    \\resumeSubheading"
+
+        yield rf"      {{{latex_escape(e.get('role',''))}}}{{{latex_escape(e.get('dates',''))}}}"
+
+        yield rf"      {{{latex_escape(e.get('org',''))}}}{{{latex_escape(e.get('location',''))}}}"
+
+
+
+        bullets = e.get("bullets", [])
+
+        if bullets:
+
+            yield "      \\resumeItemListStart"
+
+            for b in bullets:
+
+                yield rf"        \resumeItem{{{rich_segments_to_latex(b)}}}"
+
+            yield "      \\resumeItemListEnd"
+
+            yield ""
+
+    yield "  \\resumeSubHeadingListEnd"
+
+    yield ""
+
+
+
+
+
+def _latex_projects_lines(entries: list) -> Iterator[str]:
+
+    yield "  \\resumeSubHeadingListStart"
+
+    for e in entries:
+
+        title_text = latex_escape(e.get("title", ""))
+
+        stack_text = latex_escape(e.get("stack", ""))
+
+        dates_text = latex_escape(e.get("dates", ""))
+
+        left = rf"\textbf{{{title_text}}} $|$ \emph{{{stack_text}}}"
+
+        yield "      \\resumeProjectHeading"
+
+        yield rf"          {{{left}}}{{{dates_text}}}"
+
+
+
+        bullets = e.get("bullets", [])
+
+        if bullets:
+
+            yield "          \\resumeItemListStart"
+
+            for b in bullets:
+
+                yield rf"            \resumeItem{{{rich_segments_to_latex(b)}}}"
+
+            yield "          \\resumeItemListEnd"
+
+    yield "    \\resumeSubHeadingListEnd"
+
+    yield ""
+
+
+
+
+
+def _latex_skills_lines(entries: list) -> Iterator[str]:
+
+    yield " \\begin{itemize}[leftmargin=0.15in, label={}]"
+
+    yield "    \\small{\\item{"
+
+    for idx, e in enumerate(entries):
+
+        label = latex_escape(e.get("label", ""))
+
+        value = rich_segments_to_latex(e.get("value", []))
+
+        line = rf"     \textbf{{{label}}}{{: {value}}}"
+
+        if idx != len(entries) - 1:
+
+            line += r" \\\\"
+
+        yield line
+
+    yield "    }}"
+
+    yield " \\end{itemize}"
+
+    yield ""
+
+
+
+
+
+def _latex_custom_lines(entries: list) -> Iterator[str]:
+
+    for e in entries:
+
+        title_text = latex_escape(e.get("title", ""))
+
+        body_segments = e.get("body", [])
+
+        if title_text:
+
+            yield rf"\textbf{{{title_text}}}\\"
+
+        if body_segments:
+
+            yield (rich_segments_to_latex(body_segments) + r"\\")
+
+        yield ""
+
+
+
+
+
+_LATEX_SECTION_RENDERERS = {
+
+    "education": _latex_education_lines,
+
+    "experience": _latex_experience_lines,
+
+    "projects": _latex_projects_lines,
+
+    "skills": _latex_skills_lines,
+
+}
+
+
+
+
+
+def generate_latex_stream(data: dict, out) -> None:
+
+    for line in _iter_latex_lines(data):
+
+        out.write(line)
+
+        out.write("\n")
+
+
+
+
+
+def generate_latex(data: dict) -> str:
+
+    return "\n".join(_iter_latex_lines(data))
+
+
+
+
+
+_last_export_hash: Optional[str] = None
 
 
 
@@ -3926,13 +4484,35 @@ def generate_latex(data: dict) -> str:
 
 def export_latex(data: dict) -> None:
 
-    out = generate_latex(data)
+    global _last_export_hash
 
     path = _export_file_path()
 
+    # Repeated exports of unchanged data are a no-op: hash the document
+
+    # and skip the generate/write pass when it matches the last export.
+
+    try:
+
+        h = hashlib.blake2b(
+
+            json.dumps(data, sort_keys=True).encode("utf-8"), digest_size=16
+
+        ).hexdigest()
+
+    except Exception:
+
+        h = None
+
+    if h is not None and h == _last_export_hash and os.path.exists(path):
+
+        return
+
     with open(path, "w", encoding="utf-8") as f:
 
-        f.write(out)
+        generate_latex_stream(data, f)
+
+    _last_export_hash = h
 
 
 
@@ -3962,6 +4542,14 @@ class StyleState:
 
 class RichTextEditor(ttk.Frame):
 
+    # Font objects are interpreter-wide, so all editors share one cache
+
+    # instead of re-creating identical tkfont.Font objects per instance.
+
+    font_cache: Dict[Tuple[Any, ...], tkfont.Font] = {}
+
+
+
     def __init__(self, master, *, default_family: Optional[str] = None, default_size: Optional[int] = None):
 
         super().__init__(master)
@@ -3984,12 +4572,18 @@ class RichTextEditor(ttk.Frame):
 
 
 
+        # Tags are per-Text-widget; remember which are already configured
+
+        # so repeated formatting skips redundant tag_configure calls.
+
+        self._configured_tags: set = set()
+
+
+
         self.default_family = default_family or sys_family
 
         self.default_size = int(default_size or sys_size)
 
-        self.font_cache: Dict[Tuple[Any, ...], tkfont.Font] = {}
-
 
 
         toolbar = ttk.Frame(self)
@@ -4226,6 +4820,18 @@ class RichTextEditor(ttk.Frame):
 
 
 
+
+
+    def _ensure_tag(self, tag: str, **kw) -> None:
+
+        if tag not in self._configured_tags:
+
+            self.text.tag_configure(tag, **kw)
+
+            self._configured_tags.add(tag)
+
+
+
     def _get_or_create_font(self, family: str, size: int, bold: bool, italic: bool, underline: bool) -> tkfont.Font:
 
         key = (family, size, bold, italic, underline)
@@ -4248,7 +4854,11 @@ class RichTextEditor(ttk.Frame):
 
     def _style_at(self, index: str) -> StyleState:
 
-        tags = set(self.text.tag_names(index))
+        # Iterate the tuple Tk returns directly; building a set per call
+
+        # only added an allocation on every selection event.
+
+        tags = self.text.tag_names(index)
 
         family = self.default_family
 
@@ -4270,25 +4880,11 @@ class RichTextEditor(ttk.Frame):
 
             if t.startswith("f:"):
 
-                try:
-
-                    m = re.fullmatch(r"f:(.*)\|s:(\d+)\|b:(\d)\|i:(\d)\|u:(\d)", t)
-
-                    if m:
-
-                        family = m.group(1)
-
-                        size = int(m.group(2))
-
-                        bold = m.group(3) == "1"
+                parsed = _parse_font_tag(t)
 
-                        italic = m.group(4) == "1"
+                if parsed is not None:
 
-                        underline = m.group(5) == "1"
-
-                except Exception:
-
-                    pass
+                    family, size, bold, italic, underline = parsed
 
             elif t.startswith("fg:"):
 
@@ -4326,86 +4922,94 @@ class RichTextEditor(ttk.Frame):
 
 
 
-        try:
+        # Normalize both ends once; ordering and the empty-selection check
 
-            if self.text.compare(start, "==", end):
+        # are then pure-Python tuple comparisons, not Tcl round-trips.
 
-                return
+        def _pos(ix: str) -> Tuple[int, int]:
 
-        except Exception:
+            line, col = ix.split(".")
 
-            pass
+            return (int(line), int(col))
 
 
 
-        want_font_change = any(v is not None for v in (family, size, bold, italic, underline))
+        try:
 
-        want_fg_change = fg is not None
+            start_pos = _pos(self.text.index(start))
 
-        want_bg_change = bg is not None
+            end_pos = _pos(self.text.index(end))
+
+        except Exception:
+
+            return
+
+        if start_pos >= end_pos:
+
+            return
 
 
 
-        runs: List[Tuple[str, str, StyleState]] = []
+        want_font_change = any(v is not None for v in (family, size, bold, italic, underline))
 
-        idx = start
+        want_fg_change = fg is not None
 
-        run_start = start
+        want_bg_change = bg is not None
 
-        cur_style = self._style_at(start)
 
 
+        # Style can only change where a tag turns on or off, so one dump
 
-        while True:
+        # call yields every candidate boundary instead of a tag_names
 
-            try:
+        # round-trip per character of the selection.
 
-                if not self.text.compare(idx, "<", end):
+        boundaries: List[str] = []
 
-                    break
+        try:
 
-            except Exception:
+            last = None
 
-                break
+            for key, _value, index in self.text.dump(start, end, tag=True):
 
+                if key in ("tagon", "tagoff") and index != last:
 
+                    boundaries.append(index)
 
-            next_idx = self.text.index(f"{idx}+1c")
+                    last = index
 
-            try:
+        except Exception:
 
-                if self.text.compare(next_idx, ">", end):
+            boundaries = []
 
-                    next_idx = end
 
-            except Exception:
 
-                next_idx = end
+        runs: List[Tuple[str, str, StyleState]] = []
 
+        run_start = start
 
+        cur_style = self._style_at(start)
 
-            if next_idx == end:
+        for index in boundaries:
 
-                break
+            p = _pos(index)
 
+            if p <= start_pos or p >= end_pos:
 
+                continue
 
-            st_next = self._style_at(next_idx)
+            st_next = self._style_at(index)
 
             if st_next != cur_style:
 
-                runs.append((run_start, next_idx, cur_style))
+                runs.append((run_start, index, cur_style))
 
-                run_start = next_idx
+                run_start = index
 
                 cur_style = st_next
 
 
 
-            idx = next_idx
-
-
-
         runs.append((run_start, end, cur_style))
 
 
@@ -4438,7 +5042,7 @@ class RichTextEditor(ttk.Frame):
 
                 fnt = self._get_or_create_font(st.family, st.size, st.bold, st.italic, st.underline)
 
-                self.text.tag_configure(font_tag, font=fnt)
+                self._ensure_tag(font_tag, font=fnt)
 
                 self.text.tag_add(font_tag, rstart, rend)
 
@@ -4450,7 +5054,7 @@ class RichTextEditor(ttk.Frame):
 
                 fg_tag = f"fg:{fg}"
 
-                self.text.tag_configure(fg_tag, foreground=fg)
+                self._ensure_tag(fg_tag, foreground=fg)
 
                 self.text.tag_add(fg_tag, rstart, rend)
 
@@ -4462,7 +5066,7 @@ class RichTextEditor(ttk.Frame):
 
                 bg_tag = f"bg:{bg}"
 
-                self.text.tag_configure(bg_tag, background=bg)
+                self._ensure_tag(bg_tag, background=bg)
 
                 self.text.tag_add(bg_tag, rstart, rend)
 
@@ -4538,7 +5142,7 @@ class RichTextEditor(ttk.Frame):
 
                 end = self.text.index("insert wordend")
 
-                if self.text.compare(start, "<", end):
+                if tuple(map(int, start.split("."))) < tuple(map(int, end.split("."))):
 
                     self.text.tag_add("sel", start, end)
 
@@ -4568,7 +5172,7 @@ class RichTextEditor(ttk.Frame):
 
                 end = self.text.index("insert wordend")
 
-                if self.text.compare(start, "<", end):
+                if tuple(map(int, start.split("."))) < tuple(map(int, end.split("."))):
 
                     self.text.tag_add("sel", start, end)
 
@@ -4586,14 +5190,24 @@ class RichTextEditor(ttk.Frame):
 
         self.text.delete("1.0", "end")
 
-        self.text.insert("1.0", "")
-
         if not segments:
 
             return
 
 
 
+        # Stage the text and tag ranges first, then hand them to Tk in one
+
+        # insert plus one tag_add per distinct tag (tag_add accepts multiple
+
+        # index pairs), instead of an insert and several tag calls per segment.
+
+        parts: List[str] = []
+
+        tag_ranges: Dict[str, List[str]] = {}
+
+        line, col = 1, 0
+
         for seg in segments:
 
             txt = seg.get("text", "")
@@ -4602,11 +5216,23 @@ class RichTextEditor(ttk.Frame):
 
                 continue
 
-            start_index = self.text.index("end-1c")
+            start_index = f"{line}.{col}"
+
+            newlines = txt.count("\n")
+
+            if newlines:
+
+                line += newlines
 
-            self.text.insert("end", txt)
+                col = len(txt) - txt.rfind("\n") - 1
 
-            end_index = self.text.index("end-1c")
+            else:
+
+                col += len(txt)
+
+            end_index = f"{line}.{col}"
+
+            parts.append(txt)
 
 
 
@@ -4634,9 +5260,9 @@ class RichTextEditor(ttk.Frame):
 
             f = self._get_or_create_font(st.family, st.size, st.bold, st.italic, st.underline)
 
-            self.text.tag_configure(font_tag, font=f)
+            self._ensure_tag(font_tag, font=f)
 
-            self.text.tag_add(font_tag, start_index, end_index)
+            tag_ranges.setdefault(font_tag, []).extend((start_index, end_index))
 
 
 
@@ -4644,9 +5270,9 @@ class RichTextEditor(ttk.Frame):
 
                 fg_tag = f"fg:{st.fg}"
 
-                self.text.tag_configure(fg_tag, foreground=st.fg)
+                self._ensure_tag(fg_tag, foreground=st.fg)
 
-                self.text.tag_add(fg_tag, start_index, end_index)
+                tag_ranges.setdefault(fg_tag, []).extend((start_index, end_index))
 
 
 
@@ -4654,9 +5280,17 @@ class RichTextEditor(ttk.Frame):
 
                 bg_tag = f"bg:{st.bg}"
 
-                self.text.tag_configure(bg_tag, background=st.bg)
+                self._ensure_tag(bg_tag, background=st.bg)
+
+                tag_ranges.setdefault(bg_tag, []).extend((start_index, end_index))
+
+
+
+        self.text.insert("1.0", "".join(parts))
 
-                self.text.tag_add(bg_tag, start_index, end_index)
+        for tag, ranges in tag_ranges.items():
+
+            self.text.tag_add(tag, *ranges)
 
 
 
@@ -4688,29 +5322,19 @@ class RichTextEditor(ttk.Frame):
 
 
 
-        def _offset_for_index(idx: str) -> int:
-
-            try:
-
-                c = self.text.count("1.0", idx, "chars")
-
-                if c and c[0] is not None:
-
-                    return int(c[0])
-
-            except Exception:
+        line_prefix = list(itertools.accumulate(
 
-                pass
+            [0] + [len(line) + 1 for line in text.split("\n")]
 
+        ))
 
 
-            try:
 
-                return len(self.text.get("1.0", idx))
+        def _offset_for_index(idx: str) -> int:
 
-            except Exception:
+            line, col = idx.split(".")
 
-                return 0
+            return line_prefix[int(line) - 1] + int(col)
 
 
 
@@ -4768,23 +5392,13 @@ class RichTextEditor(ttk.Frame):
 
                 return (self.default_family, self.default_size, False, False, False)
 
-            m = re.fullmatch(r"f:(.*)\|s:(\d+)\|b:(\d)\|i:(\d)\|u:(\d)", font_tag)
+            parsed = _parse_font_tag(font_tag)
 
-            if not m:
+            if parsed is None:
 
                 return (self.default_family, self.default_size, False, False, False)
 
-            family = m.group(1)
-
-            size = int(m.group(2))
-
-            b = m.group(3) == "1"
-
-            i = m.group(4) == "1"
-
-            u = m.group(5) == "1"
-
-            return (family, size, b, i, u)
+            return parsed
 
 
 
@@ -4878,103 +5492,89 @@ class RichTextEditor(ttk.Frame):
 
 
 
-        for pos in range(0, len(text)):
-
-            if pos in intervals_add:
-
-                for kind, value in intervals_add[pos]:
-
-                    if kind == "font":
-
-                        active_font_tag = value
-
-                    elif kind == "fg":
-
-                        active_fg = value
+        n = len(text)
 
-                    elif kind == "bg":
+        boundaries = sorted(
 
-                        active_bg = value
+            {off for off in intervals_add if off < n}
 
+            | {off for off in intervals_remove if off < n}
 
+            | {0, n}
 
-            new_family, new_size, new_b, new_i, new_u = _style_from_font_tag(active_font_tag)
-
-            new_style = {
+        )
 
-                "family": new_family,
+        for bi in range(len(boundaries) - 1):
 
-                "size": new_size,
+            a = boundaries[bi]
 
-                "b": new_b,
+            b = boundaries[bi + 1]
 
-                "i": new_i,
 
-                "u": new_u,
 
-                "fg": active_fg,
+            for kind, value in intervals_remove.get(a, ()):
 
-                "bg": active_bg,
+                if kind == "font" and active_font_tag == value:
 
-            }
+                    active_font_tag = None
 
+                elif kind == "fg" and active_fg == value:
 
+                    active_fg = None
 
-            if (
+                elif kind == "bg" and active_bg == value:
 
-                cur_text_parts
+                    active_bg = None
 
-                and (
 
-                    cur["family"] != new_style["family"]
 
-                    or cur["size"] != new_style["size"]
+            for kind, value in intervals_add.get(a, ()):
 
-                    or cur["b"] != new_style["b"]
+                if kind == "font":
 
-                    or cur["i"] != new_style["i"]
+                    active_font_tag = value
 
-                    or cur["u"] != new_style["u"]
+                elif kind == "fg":
 
-                    or cur["fg"] != new_style["fg"]
+                    active_fg = value
 
-                    or cur["bg"] != new_style["bg"]
+                elif kind == "bg":
 
-                )
+                    active_bg = value
 
-            ):
 
-                _flush()
 
-                cur.update(new_style)
+            new_family, new_size, new_b, new_i, new_u = _style_from_font_tag(active_font_tag)
 
+            new_style = {
 
+                "family": new_family,
 
-            if not cur_text_parts:
+                "size": new_size,
 
-                cur.update(new_style)
+                "b": new_b,
 
+                "i": new_i,
 
+                "u": new_u,
 
-            cur_text_parts.append(text[pos])
+                "fg": active_fg,
 
+                "bg": active_bg,
 
+            }
 
-            if (pos + 1) in intervals_remove:
 
-                for kind, value in intervals_remove[pos + 1]:
 
-                    if kind == "font" and active_font_tag == value:
+            if cur != new_style:
 
-                        active_font_tag = None
+                _flush()
 
-                    elif kind == "fg" and active_fg == value:
+                cur.update(new_style)
 
-                        active_fg = None
 
-                    elif kind == "bg" and active_bg == value:
 
-                        active_bg = None
+            cur_text_parts.append(text[a:b])
 
 
 
@@ -5260,7 +5860,7 @@ class BulletEditorDialog(tk.Toplevel):
 
             self._drag_tip_win.geometry(f"+{x}+{y}")
 
-        except Exception:
+        except tk.TclError:
 
             return
 
@@ -5276,7 +5876,7 @@ class BulletEditorDialog(tk.Toplevel):
 
             self._drag_tip_win.geometry(f"+{x}+{y}")
 
-        except Exception:
+        except tk.TclError:
 
             return
 
@@ -5290,7 +5890,7 @@ class BulletEditorDialog(tk.Toplevel):
 
                 self._drag_tip_win.destroy()
 
-        except Exception:
+        except tk.TclError:
 
             pass
 
@@ -5492,6 +6092,16 @@ class BulletEditorDialog(tk.Toplevel):
 
         self._cancel_autosave_job()
 
+        # The editor buffer holds exactly one bullet, so the dirty flag is the
+
+        # span-level granularity already: an untouched buffer is never
+
+        # re-serialized.
+
+        if not self.dirty:
+
+            return
+
         idx = int(self.active_index)
 
         if not (0 <= idx < len(self.bullets)):
@@ -5882,6 +6492,8 @@ class PreviewDialog(tk.Toplevel):
 
         self.font_cache: Dict[Tuple[Any, ...], tkfont.Font] = {}
 
+        self._configured_tags: set = set()
+
 
 
         root = ttk.Frame(self)
@@ -6056,7 +6668,7 @@ class PreviewDialog(tk.Toplevel):
 
     def _insert_segments(self, segments: List[Dict[str, Any]], *, base_family: str, base_size: int):
 
-        for idx, seg in enumerate(segments or []):
+        for seg in segments or []:
 
             txt = seg.get("text", "")
 
@@ -6080,19 +6692,31 @@ class PreviewDialog(tk.Toplevel):
 
 
 
-            tag = f"seg_{self.rendered_text.index('end')}__{idx}"
+            # Deterministic tag name per style, so identical styles across the
+
+            # document share one configured tag instead of growing the tag
+
+            # table by one entry per inserted segment.
+
+            tag = f"pv:{family}|{size}|{int(bold)}|{int(italic)}|{int(underline)}|{fg or ''}|{bg or ''}"
+
+            if tag not in self._configured_tags:
+
+                f = self._get_font(family, size, bold, italic, underline)
 
-            f = self._get_font(family, size, bold, italic, underline)
+                kw: Dict[str, Any] = {"font": f}
 
-            self.rendered_text.tag_configure(tag, font=f)
+                if fg:
 
-            if fg:
+                    kw["foreground"] = fg
 
-                self.rendered_text.tag_configure(tag, foreground=fg)
+                if bg:
 
-            if bg:
+                    kw["background"] = bg
 
-                self.rendered_text.tag_configure(tag, background=bg)
+                self.rendered_text.tag_configure(tag, **kw)
+
+                self._configured_tags.add(tag)
 
 
 
@@ -6108,9 +6732,15 @@ class PreviewDialog(tk.Toplevel):
 
     def _build_rendered_preview(self):
 
-        self.rendered_text.configure(state="normal")
+        # Bulk rebuild: bind the widget once and leave it disabled until the
+
+        # end so nothing is interactively editable mid-build.
+
+        rt = self.rendered_text
+
+        rt.configure(state="normal")
 
-        self.rendered_text.delete("1.0", "end")
+        rt.delete("1.0", "end")
 
 
 
@@ -6140,19 +6770,19 @@ class PreviewDialog(tk.Toplevel):
 
 
 
-        self.rendered_text.tag_configure("center", justify="center")
+        rt.tag_configure("center", justify="center")
 
-        self.rendered_text.tag_configure("name", font=name_font, justify="center")
+        rt.tag_configure("name", font=name_font, justify="center")
 
-        self.rendered_text.tag_configure("contact", font=self._get_font(base_family, base_size, False, False, False), justify="center")
+        rt.tag_configure("contact", font=self._get_font(base_family, base_size, False, False, False), justify="center")
 
-        self.rendered_text.tag_configure("section", font=section_font)
+        rt.tag_configure("section", font=section_font)
 
-        self.rendered_text.tag_configure("subhead", font=subhead_font)
+        rt.tag_configure("subhead", font=subhead_font)
 
-        self.rendered_text.tag_configure("italic", font=italic_font)
+        rt.tag_configure("italic", font=italic_font)
 
-        self.rendered_text.tag_configure("spacer", spacing1=8, spacing3=8)
+        rt.tag_configure("spacer", spacing1=8, spacing3=8)
 
 
 
@@ -6194,13 +6824,13 @@ class PreviewDialog(tk.Toplevel):
 
 
 
-        self.rendered_text.insert("end", (name + "\n"), ("name", "center"))
+        rt.insert("end", (name + "\n"), ("name", "center"))
 
         if contact_parts:
 
-            self.rendered_text.insert("end", (" | ".join(contact_parts) + "\n"), ("contact", "center"))
+            rt.insert("end", (" | ".join(contact_parts) + "\n"), ("contact", "center"))
 
-        self.rendered_text.insert("end", "\n")
+        rt.insert("end", "\n")
 
 
 
@@ -6214,9 +6844,9 @@ class PreviewDialog(tk.Toplevel):
 
 
 
-            self.rendered_text.insert("end", title + "\n", ("section",))
+            rt.insert("end", title + "\n", ("section",))
 
-            self.rendered_text.insert("end", "―" * 60 + "\n")
+            rt.insert("end", "―" * 60 + "\n")
 
 
 
@@ -6242,7 +6872,7 @@ class PreviewDialog(tk.Toplevel):
 
                         line1 += "    " + location
 
-                    self.rendered_text.insert("end", line1 + "\n", ("subhead",))
+                    rt.insert("end", line1 + "\n", ("subhead",))
 
 
 
@@ -6252,19 +6882,19 @@ class PreviewDialog(tk.Toplevel):
 
                         line2 += "    " + dates
 
-                    self.rendered_text.insert("end", line2 + "\n", ("italic",))
+                    rt.insert("end", line2 + "\n", ("italic",))
 
 
 
                     if body:
 
-                        self.rendered_text.insert("end", "  • ")
+                        rt.insert("end", "  • ")
 
                         self._insert_segments(body, base_family=base_family, base_size=base_size)
 
-                        self.rendered_text.insert("end", "\n")
+                        rt.insert("end", "\n")
 
-                    self.rendered_text.insert("end", "\n")
+                    rt.insert("end", "\n")
 
 
 
@@ -6288,7 +6918,7 @@ class PreviewDialog(tk.Toplevel):
 
                         line1 += "    " + dates
 
-                    self.rendered_text.insert("end", line1 + "\n", ("subhead",))
+                    rt.insert("end", line1 + "\n", ("subhead",))
 
 
 
@@ -6298,19 +6928,19 @@ class PreviewDialog(tk.Toplevel):
 
                         line2 += "    " + location
 
-                    self.rendered_text.insert("end", line2 + "\n", ("italic",))
+                    rt.insert("end", line2 + "\n", ("italic",))
 
 
 
                     for b in e.get("bullets", []) or []:
 
-                        self.rendered_text.insert("end", "  • ")
+                        rt.insert("end", "  • ")
 
                         self._insert_segments(b, base_family=base_family, base_size=base_size)
 
-                        self.rendered_text.insert("end", "\n")
+                        rt.insert("end", "\n")
 
-                    self.rendered_text.insert("end", "\n")
+                    rt.insert("end", "\n")
 
 
 
@@ -6336,19 +6966,19 @@ class PreviewDialog(tk.Toplevel):
 
                         header_line += "    " + dates
 
-                    self.rendered_text.insert("end", header_line + "\n", ("subhead",))
+                    rt.insert("end", header_line + "\n", ("subhead",))
 
 
 
                     for b in e.get("bullets", []) or []:
 
-                        self.rendered_text.insert("end", "  • ")
+                        rt.insert("end", "  • ")
 
                         self._insert_segments(b, base_family=base_family, base_size=base_size)
 
-                        self.rendered_text.insert("end", "\n")
+                        rt.insert("end", "\n")
 
-                    self.rendered_text.insert("end", "\n")
+                    rt.insert("end", "\n")
 
 
 
@@ -6358,13 +6988,13 @@ class PreviewDialog(tk.Toplevel):
 
                     label = e.get("label", "")
 
-                    self.rendered_text.insert("end", f"{label}: ", ("subhead",))
+                    rt.insert("end", f"{label}: ", ("subhead",))
 
                     self._insert_segments(e.get("value", []), base_family=base_family, base_size=base_size)
 
-                    self.rendered_text.insert("end", "\n")
+                    rt.insert("end", "\n")
 
-                self.rendered_text.insert("end", "\n")
+                rt.insert("end", "\n")
 
 
 
@@ -6376,7 +7006,7 @@ class PreviewDialog(tk.Toplevel):
 
                     if etitle:
 
-                        self.rendered_text.insert("end", etitle + "\n", ("subhead",))
+                        rt.insert("end", etitle + "\n", ("subhead",))
 
                     body = e.get("body", [])
 
@@ -6384,13 +7014,13 @@ class PreviewDialog(tk.Toplevel):
 
                         self._insert_segments(body, base_family=base_family, base_size=base_size)
 
-                        self.rendered_text.insert("end", "\n")
+                        rt.insert("end", "\n")
 
-                    self.rendered_text.insert("end", "\n")
+                    rt.insert("end", "\n")
 
 
 
-        self.rendered_text.configure(state="disabled")
+        rt.configure(state="disabled")
 
 
 
@@ -6418,6 +7048,8 @@ class EntryEditorDialog(tk.Toplevel):
 
         on_change: Optional[Callable[[dict], None]] = None,
 
+        on_done: Optional[Callable[[Optional[dict]], None]] = None,
+
     ):
 
         super().__init__(master)
@@ -6432,6 +7064,8 @@ class EntryEditorDialog(tk.Toplevel):
 
         self._on_change = on_change
 
+        self._on_done = on_done
+
         self._notify_job = None
 
 
@@ -6824,6 +7458,10 @@ class EntryEditorDialog(tk.Toplevel):
 
         self.destroy()
 
+        if self._on_done is not None:
+
+            self._on_done(self.result)
+
 
 
     def on_cancel(self):
@@ -6834,12 +7472,140 @@ class EntryEditorDialog(tk.Toplevel):
 
         self.destroy()
 
+        if self._on_done is not None:
+
+            self._on_done(None)
+
+
+
+
+
+
+
+
+
+# Fresh-entry shapes per section kind; add_entry deep-copies one of these
+
+# instead of rebuilding the literal on every invocation.
+
+_EMPTY_ENTRY_TEMPLATES: Dict[str, dict] = {
+
+    "education": {"school": "", "location": "", "degree": "", "dates": ""},
+
+    "experience": {"role": "", "dates": "", "org": "", "location": "", "bullets": [[{"text": ""}]]},
+
+    "projects": {"title": "", "stack": "", "dates": "", "bullets": [[{"text": ""}]]},
+
+    "skills": {"label": "", "value": [{"text": ""}]},
+
+    "_default": {"title": "", "body": [{"text": ""}]},
+
+}
+
+
+
+
+
+@dataclass
+
+class EditCommand:
+
+    """Scoped undo record: the pre-change value of one subtree of the data.
+
+
+
+    Pushed on the undo/redo stacks alongside full snapshots; undoing one
+
+    grafts ``old`` back in at ``path`` instead of rebuilding the document,
+
+    so the cost is proportional to the edited subtree, not the resume.
+
+    """
+
+
+
+    path: Tuple[Any, ...]
+
+    old: Any
+
+
+
+
+
+def _get_at_path(root: Any, path: Tuple[Any, ...]) -> Any:
+
+    node = root
+
+    for key in path:
+
+        node = node[key]
+
+    return node
+
+
+
+
+
+def _set_at_path(root: Any, path: Tuple[Any, ...], value: Any) -> None:
+
+    node = root
+
+    for key in path[:-1]:
+
+        node = node[key]
+
+    node[path[-1]] = value
+
+
+
+
+
+def _with_selected_entry(fn):
+
+    # Shared guard for entry-level actions: resolve the selected section
+
+    # and entry once and bail out when nothing valid is selected.
+
+    @functools.wraps(fn)
+
+    def wrapper(self):
+
+        sidx = self._selected_section_index()
+
+        eidx = self._selected_entry_index()
+
+        if sidx < 0 or eidx < 0:
+
+            return
+
+        sections = self.data.setdefault("sections", [])
+
+        sec = sections[sidx]
+
+        entries = sec.get("entries", [])
+
+        if eidx >= len(entries):
+
+            return
+
+        return fn(self, sidx, sec, entries, eidx)
+
+
+
+    return wrapper
+
 
 
 
 
 class ResumeApp(ttk.Frame):
 
+    # Undo history cap; the deque drops the oldest checkpoint in O(1).
+
+    MAX_UNDO = 100
+
+    _cached_header_left_col_px: Optional[int] = None
+
     def __init__(self, master):
 
         super().__init__(master)
@@ -6856,6 +7622,12 @@ class ResumeApp(ttk.Frame):
 
         self._file_menu: Optional[tk.Menu] = None
 
+        self._edit_menu: Optional[tk.Menu] = None
+
+        self._settings_menu: Optional[tk.Menu] = None
+
+        self._help_menu: Optional[tk.Menu] = None
+
 
 
         self.spellcheck_manager = SpellCheckManager(self.master)
@@ -6876,15 +7648,37 @@ class ResumeApp(ttk.Frame):
 
 
 
-        self.undo_stack: List[dict] = []
+        self.undo_stack: deque = deque(maxlen=self.MAX_UNDO)
+
+        self.redo_stack: deque = deque()
 
-        self.redo_stack: List[dict] = []
+        self._undo_baseline: Optional[dict] = None
+
+        self._header_link_ui_kinds: Optional[Tuple[str, str]] = None
+
+        self._undo_ops_since_baseline = 0
 
         self._suspend_undo = False
 
-        self._header_typing_in_progress = False
+        self._pending_checkpoint_source: Optional[str] = None
+
+        self._pending_checkpoint_job = None
+
+        self._dirty_header_keys: set = set()
 
-        self._header_commit_job = None
+        self._export_executor = None
+
+        self._suspend_refresh = False
+
+        self._toast_label = None
+
+        self._toast_job = None
+
+        self._entry_fill_job = None
+
+        self._ui_sync_pending = False
+
+        self._row_cache: Dict[int, Tuple[Any, str, str]] = {}
 
 
 
@@ -6916,7 +7710,7 @@ class ResumeApp(ttk.Frame):
 
         self._bind_undo_redo_shortcuts()
 
-        self._update_undo_redo_buttons()
+        self._schedule_ui_sync()
 
         self._update_save_project_buttons()
 
@@ -7574,7 +8368,7 @@ class ResumeApp(ttk.Frame):
 
             self._apply_state(state)
 
-            self._update_undo_redo_buttons()
+            self._schedule_ui_sync()
 
         except Exception:
 
@@ -7962,6 +8756,10 @@ class ResumeApp(ttk.Frame):
 
         def _coerce_segments(val: Any) -> List[dict]:
 
+            # Callers only pass values that _normalize_entry has already
+
+            # deep-copied, so no defensive copies are needed here.
+
             if val is None:
 
                 return []
@@ -7972,13 +8770,13 @@ class ResumeApp(ttk.Frame):
 
             if isinstance(val, dict) and "text" in val:
 
-                return [deep_copy(val)]
+                return [val]
 
             if isinstance(val, list):
 
                 if all(isinstance(x, dict) and "text" in x for x in val):
 
-                    return deep_copy(val)
+                    return val
 
                 if all(isinstance(x, str) for x in val):
 
@@ -8036,87 +8834,87 @@ class ResumeApp(ttk.Frame):
 
 
 
-        if sections_list:
+        def _coerce_bullets_or_body(ee: dict) -> List[List[dict]]:
 
-            normalized_sections: List[dict] = []
+            if "bullets" in ee:
 
-            for sec in sections_list:
+                return _coerce_bullets(ee.get("bullets"))
 
-                if not isinstance(sec, dict):
+            if "body" in ee:
 
-                    continue
+                body_segs = _coerce_segments(ee.pop("body", None))
 
-                s = deep_copy(sec)
+                return [body_segs] if body_segs else []
 
-                sec_id = s.get("id")
+            return []
 
-                if sec_id in defaults_by_id:
 
-                    default_sec = defaults_by_id[sec_id]
 
-                    for k in ("title", "kind"):
+        def _normalize_entry(kind: Any, e: dict) -> dict:
 
-                        if not s.get(k) and default_sec.get(k):
+            ee = deep_copy(e)
 
-                            s[k] = default_sec.get(k)
+            if kind == "education":
 
+                ee["body"] = _coerce_segments(ee.get("body"))
 
+            elif kind in ("experience", "projects"):
 
-                if not isinstance(s.get("entries"), list):
+                ee["bullets"] = _coerce_bullets_or_body(ee)
 
-                    s["entries"] = []
+            elif kind == "skills":
 
+                ee["value"] = _coerce_segments(ee.get("value"))
 
+            else:
 
-                kind = s.get("kind")
+                ee["body"] = _coerce_segments(ee.get("body"))
 
-                normalized_entries: List[dict] = []
+            return ee
 
-                for e in s.get("entries", []) or []:
 
-                    if not isinstance(e, dict):
 
-                        continue
+        if sections_list:
 
-                    ee = deep_copy(e)
+            normalized_sections: List[dict] = []
 
-                    if kind == "education":
+            for sec in sections_list:
 
-                        ee["body"] = _coerce_segments(ee.get("body"))
+                if not isinstance(sec, dict):
 
-                    elif kind in ("experience", "projects"):
+                    continue
 
-                        if "bullets" in ee:
+                s = deep_copy(sec)
 
-                            ee["bullets"] = _coerce_bullets(ee.get("bullets"))
+                sec_id = s.get("id")
 
-                        elif "body" in ee:
+                if sec_id in defaults_by_id:
 
-                            body_segs = _coerce_segments(ee.get("body"))
+                    default_sec = defaults_by_id[sec_id]
 
-                            ee["bullets"] = [body_segs] if body_segs else []
+                    for k in ("title", "kind"):
 
-                            ee.pop("body", None)
+                        if not s.get(k) and default_sec.get(k):
 
-                        else:
+                            s[k] = default_sec.get(k)
 
-                            ee["bullets"] = _coerce_bullets([])
 
-                    elif kind == "skills":
 
-                        ee["value"] = _coerce_segments(ee.get("value"))
+                if not isinstance(s.get("entries"), list):
 
-                    else:
+                    s["entries"] = []
 
-                        ee["body"] = _coerce_segments(ee.get("body"))
 
 
+                kind = s.get("kind")
 
-                    normalized_entries.append(ee)
+                raw_entries = s.get("entries") or []
 
+                s["entries"] = [
 
+                    _normalize_entry(kind, e) for e in raw_entries if isinstance(e, dict)
 
-                s["entries"] = normalized_entries
+                ]
 
                 normalized_sections.append(s)
 
@@ -8158,28 +8956,10 @@ class ResumeApp(ttk.Frame):
 
         file_btn = ttk.Menubutton(topbar_row1, text="File")
 
-        file_menu = tk.Menu(file_btn, tearoff=False)
+        file_menu = tk.Menu(file_btn, tearoff=False, postcommand=self._populate_file_menu)
 
         self._file_menu = file_menu
 
-
-
-        file_menu.add_command(label="Save", command=self.save_project, state="disabled")
-
-        self._file_menu_save_index = file_menu.index("end")
-
-        file_menu.add_command(label="Save project as .json...", command=self.save_as)
-
-        file_menu.add_command(label="Load project from .json file...", command=self.load_from_file)
-
-        file_menu.add_separator()
-
-        file_menu.add_command(label="Export LaTeX as .tex...", command=self.export_as_tex)
-
-        file_menu.add_command(label="Export as Word Document...", command=self.export_as_docx)
-
-        file_menu.add_command(label="Export as PDF...", command=self.export_as_pdf)
-
         file_btn.configure(menu=file_menu)
 
         file_btn.pack(side=tk.LEFT, padx=(0, 6))
@@ -8188,15 +8968,9 @@ class ResumeApp(ttk.Frame):
 
         edit_btn = ttk.Menubutton(topbar_row1, text="Edit")
 
-        edit_menu = tk.Menu(edit_btn, tearoff=False)
-
-        edit_menu.add_command(label="Undo", command=self.undo)
-
-        edit_menu.add_command(label="Redo", command=self.redo)
-
-        edit_menu.add_separator()
+        edit_menu = tk.Menu(edit_btn, tearoff=False, postcommand=self._populate_edit_menu)
 
-        edit_menu.add_command(label="Delete all", command=self.delete_all)
+        self._edit_menu = edit_menu
 
         edit_btn.configure(menu=edit_menu)
 
@@ -8206,55 +8980,9 @@ class ResumeApp(ttk.Frame):
 
         settings_btn = ttk.Menubutton(topbar_row1, text="Settings")
 
-        settings_menu = tk.Menu(settings_btn, tearoff=False)
-
-
-
-        def _toggle_spellcheck():
-
-            enabled = bool(self.var_spellcheck.get())
-
-            if enabled and not self.spellcheck_manager._ensure_spellchecker():
-
-                messagebox.showerror(
-
-                    "Spellcheck Unavailable",
-
-                    "Spellcheck requires the 'pyspellchecker' package.\n\nInstall it with: pip install pyspellchecker",
-
-                )
-
-                self.var_spellcheck.set(False)
-
-                enabled = False
-
-
-
-            self.spellcheck_manager.set_enabled(enabled)
-
-
-
-        settings_menu.add_checkbutton(
-
-            label="Enable Spellcheck",
-
-            variable=self.var_spellcheck,
-
-            command=_toggle_spellcheck,
-
-        )
-
-
-
-        settings_menu.add_command(
-
-            label="Edit Document Spellcheck Data...",
-
-            command=self._open_spellcheck_data_editor,
-
-        )
-
+        settings_menu = tk.Menu(settings_btn, tearoff=False, postcommand=self._populate_settings_menu)
 
+        self._settings_menu = settings_menu
 
         settings_btn.configure(menu=settings_menu)
 
@@ -8264,11 +8992,9 @@ class ResumeApp(ttk.Frame):
 
         help_btn = ttk.Menubutton(topbar_row1, text="Help")
 
-        help_menu = tk.Menu(help_btn, tearoff=False)
-
-        help_menu.add_command(label="Quick Start Guide", command=self._open_quick_start_guide)
+        help_menu = tk.Menu(help_btn, tearoff=False, postcommand=self._populate_help_menu)
 
-        help_menu.add_command(label="Detailed Help", command=self._open_detailed_help)
+        self._help_menu = help_menu
 
         help_btn.configure(menu=help_menu)
 
@@ -8358,37 +9084,35 @@ class ResumeApp(ttk.Frame):
 
 
 
-        try:
-
-            tmp_cb = ttk.Combobox(header, values=("X (Twitter)",), state="readonly", width=header_left_col_chars)
+        cb_px = ResumeApp._cached_header_left_col_px
 
-            tmp_cb.pack()
+        if cb_px is None:
 
             try:
 
-                self.master.update_idletasks()
+                tmp_cb = ttk.Combobox(header, values=("X (Twitter)",), state="readonly", width=header_left_col_chars)
 
-            except Exception:
+                tmp_cb.pack()
 
-                pass
+                cb_px = int(tmp_cb.winfo_reqwidth() or 0)
 
-            cb_px = int(tmp_cb.winfo_reqwidth() or 0)
+                try:
 
-            try:
+                    tmp_cb.destroy()
 
-                tmp_cb.destroy()
+                except Exception:
 
-            except Exception:
+                    pass
 
-                pass
+                ResumeApp._cached_header_left_col_px = cb_px
 
-            if cb_px > 0:
+            except Exception:
 
-                header_left_col_minsize = max(int(header_left_col_minsize), cb_px + header_left_col_padx)
+                cb_px = 0
 
-        except Exception:
+        if cb_px > 0:
 
-            pass
+            header_left_col_minsize = max(int(header_left_col_minsize), cb_px + header_left_col_padx)
 
 
 
@@ -8514,7 +9238,7 @@ class ResumeApp(ttk.Frame):
 
 
 
-            var.trace_add("write", lambda *_a: self._on_header_var_changed())
+            var.trace_add("write", lambda *_a, _k=key: self._on_header_var_changed(_k))
 
 
 
@@ -8656,17 +9380,15 @@ class ResumeApp(ttk.Frame):
 
                 self._header_last_kind[kind_key] = selected
 
-                self._update_header_link_field_states()
-
-                self._update_header_platform_text_labels()
+                self._refresh_header_link_ui()
 
-                self._on_header_var_changed()
+                self._on_header_var_changed(kind_key)
 
 
 
             cb.bind("<<ComboboxSelected>>", _on_kind_selected)
 
-            var.trace_add("write", lambda *_a: self._on_header_var_changed())
+            var.trace_add("write", lambda *_a, _k=url_key: self._on_header_var_changed(_k))
 
 
 
@@ -8686,9 +9408,7 @@ class ResumeApp(ttk.Frame):
 
 
 
-        self._update_header_link_field_states()
-
-        self._update_header_platform_text_labels()
+        self._refresh_header_link_ui()
 
 
 
@@ -8862,44 +9582,152 @@ class ResumeApp(ttk.Frame):
 
 
 
-    def _selected_section_index(self) -> int:
+    def _populate_file_menu(self) -> None:
 
-        try:
+        menu = self._file_menu
 
-            sel = self.sections_tree.selection()
+        if menu is None or menu.index("end") is not None:
 
-            if not sel:
+            return
 
-                return -1
+        menu.add_command(label="Save", command=self.save_project, state="disabled")
 
-            return int(sel[0])
+        self._file_menu_save_index = menu.index("end")
 
-        except Exception:
+        menu.add_command(label="Save project as .json...", command=self.save_as)
 
-            return -1
+        menu.add_command(label="Load project from .json file...", command=self.load_from_file)
 
+        menu.add_separator()
 
+        menu.add_command(label="Export LaTeX as .tex...", command=self.export_as_tex)
 
-    def _selected_entry_index(self) -> int:
+        menu.add_command(label="Export as Word Document...", command=self.export_as_docx)
 
-        try:
+        menu.add_command(label="Export as PDF...", command=self.export_as_pdf)
 
-            sel = self.entries_tree.selection()
+        menu.configure(postcommand="")
 
-            if not sel:
+        self._update_save_project_buttons()
 
-                return -1
 
-            return int(sel[0])
 
-        except Exception:
+    def _populate_edit_menu(self) -> None:
 
-            return -1
+        menu = self._edit_menu
+
+        if menu is None or menu.index("end") is not None:
+
+            return
+
+        menu.add_command(label="Undo", command=self.undo)
+
+        menu.add_command(label="Redo", command=self.redo)
+
+        menu.add_separator()
+
+        menu.add_command(label="Delete all", command=self.delete_all)
+
+        menu.configure(postcommand="")
+
+
+
+    def _populate_settings_menu(self) -> None:
+
+        menu = self._settings_menu
+
+        if menu is None or menu.index("end") is not None:
+
+            return
+
+
+
+        def _toggle_spellcheck():
+
+            enabled = bool(self.var_spellcheck.get())
+
+            if enabled and not self.spellcheck_manager._ensure_spellchecker():
+
+                messagebox.showerror(
+
+                    "Spellcheck Unavailable",
+
+                    "Spellcheck requires the 'pyspellchecker' package.\n\nInstall it with: pip install pyspellchecker",
+
+                )
+
+                self.var_spellcheck.set(False)
+
+                enabled = False
+
+
+
+            self.spellcheck_manager.set_enabled(enabled)
+
+
+
+        menu.add_checkbutton(
+
+            label="Enable Spellcheck",
+
+            variable=self.var_spellcheck,
+
+            command=_toggle_spellcheck,
+
+        )
+
+
+
+        menu.add_command(
+
+            label="Edit Document Spellcheck Data...",
+
+            command=self._open_spellcheck_data_editor,
+
+        )
+
+        menu.configure(postcommand="")
+
+
+
+    def _populate_help_menu(self) -> None:
+
+        menu = self._help_menu
+
+        if menu is None or menu.index("end") is not None:
+
+            return
+
+        menu.add_command(label="Quick Start Guide", command=self._open_quick_start_guide)
+
+        menu.add_command(label="Detailed Help", command=self._open_detailed_help)
+
+        menu.configure(postcommand="")
+
+
+
+    def _selected_section_index(self) -> int:
+
+        sel = self.sections_tree.selection()
+
+        return int(sel[0]) if sel else -1
+
+
+
+    def _selected_entry_index(self) -> int:
+
+        sel = self.entries_tree.selection()
+
+        return int(sel[0]) if sel else -1
 
 
 
     def refresh_sections(self):
 
+        if self._suspend_refresh:
+
+            return
+
         prev_idx = -1
 
         try:
@@ -8936,55 +9764,47 @@ class ResumeApp(ttk.Frame):
 
         if sections:
 
-            target = -1
-
-            if 0 <= prev_idx < len(sections):
+            if 0 <= prev_idx < len(sections) and sections[prev_idx].get("entries"):
 
                 target = prev_idx
 
             else:
 
-                for i, sec in enumerate(sections):
-
-                    if sec.get("entries"):
-
-                        target = i
-
-                        break
+                fallback = prev_idx if 0 <= prev_idx < len(sections) else 0
 
-            if target < 0:
+                target = next((i for i, sec in enumerate(sections) if sec.get("entries")), fallback)
 
-                target = 0
 
 
+            # selection_set fires <<TreeviewSelect>>, which is bound to
 
-            if not sections[target].get("entries"):
+            # on_section_selected; no direct dispatch needed.
 
-                for i, sec in enumerate(sections):
+            self.sections_tree.selection_set(str(target))
 
-                    if sec.get("entries"):
+        else:
 
-                        target = i
+            for iid in self.entries_tree.get_children(""):
 
-                        break
+                self.entries_tree.delete(iid)
 
+            self._update_entry_action_buttons()
 
 
-            self.sections_tree.selection_set(str(target))
 
-            self.on_section_selected(None)
+    # Rows inserted synchronously on refresh; the rest stream in at idle.
 
-        else:
+    _ENTRY_FILL_CHUNK = 50
 
-            for iid in self.entries_tree.get_children(""):
 
-                self.entries_tree.delete(iid)
 
-            self._update_entry_action_buttons()
+    def refresh_entries(self):
 
+        if self._suspend_refresh:
 
+            return
 
-    def refresh_entries(self):
+        self._cancel_entry_fill()
 
         for iid in self.entries_tree.get_children(""):
 
@@ -9006,11 +9826,25 @@ class ResumeApp(ttk.Frame):
 
 
 
-        for idx, e in enumerate(entries):
+        first = min(len(entries), self._ENTRY_FILL_CHUNK)
+
+        for idx in range(first):
 
             self.entries_tree.insert(
 
-                "", "end", iid=str(idx), values=(self._entry_summary(kind, e),)
+                "", "end", iid=str(idx), values=(self._entry_summary(kind, entries[idx]),)
+
+            )
+
+        if first < len(entries):
+
+            # Large section: paint a screenful now, stream the remainder in
+
+            # idle-time chunks so selection stays responsive.
+
+            self._entry_fill_job = self.after_idle(
+
+                lambda: self._fill_entry_rows(kind, entries, first)
 
             )
 
@@ -9030,6 +9864,60 @@ class ResumeApp(ttk.Frame):
 
 
 
+    def _cancel_entry_fill(self) -> None:
+
+        if self._entry_fill_job is not None:
+
+            try:
+
+                self.after_cancel(self._entry_fill_job)
+
+            except Exception:
+
+                pass
+
+            self._entry_fill_job = None
+
+
+
+    def _rewrite_entry_rows(self, kind, entries: list, lo: int, hi: int) -> None:
+
+        # Positional iids are the file-wide addressing scheme (trees, drag
+
+        # state, session drafts, undo paths), so removals and reorders
+
+        # rewrite the affected rows' values in place rather than re-keying.
+
+        for i in range(lo, hi):
+
+            self.entries_tree.item(str(i), values=(self._entry_summary(kind, entries[i]),))
+
+
+
+    def _fill_entry_rows(self, kind, entries: list, start: int) -> None:
+
+        self._entry_fill_job = None
+
+        end = min(len(entries), start + self._ENTRY_FILL_CHUNK)
+
+        for idx in range(start, end):
+
+            self.entries_tree.insert(
+
+                "", "end", iid=str(idx), values=(self._entry_summary(kind, entries[idx]),)
+
+            )
+
+        if end < len(entries):
+
+            self._entry_fill_job = self.after_idle(
+
+                lambda: self._fill_entry_rows(kind, entries, end)
+
+            )
+
+
+
     def _update_entry_action_buttons(self) -> None:
 
         if not hasattr(self, "btn_entry_edit") or not hasattr(self, "btn_entry_delete"):
@@ -9038,19 +9926,39 @@ class ResumeApp(ttk.Frame):
 
 
 
-        has_entries = len(self.entries_tree.get_children("")) > 0
+        has_entries = len(self.entries_tree.get_children("")) > 0
+
+        has_selection = self._selected_entry_index() >= 0
+
+
+
+        self.btn_entry_edit.configure(state=("normal" if has_selection else "disabled"))
+
+        self.btn_entry_delete.configure(state=("normal" if has_entries else "disabled"))
+
+
+
+    def _entry_summary(self, kind: str, e: dict) -> str:
+
+        # Entry dicts are replaced on edit, never mutated in place, so an
+
+        # identity hit means the cached summary is still current.
+
+        cached = self._row_cache.get(id(e))
 
-        has_selection = self._selected_entry_index() >= 0
+        if cached is not None and cached[0] is e and cached[1] == kind:
 
+            return cached[2]
 
+        summary = self._entry_summary_uncached(kind, e)
 
-        self.btn_entry_edit.configure(state=("normal" if has_selection else "disabled"))
+        self._row_cache[id(e)] = (e, kind, summary)
 
-        self.btn_entry_delete.configure(state=("normal" if has_entries else "disabled"))
+        return summary
 
 
 
-    def _entry_summary(self, kind: str, e: dict) -> str:
+    def _entry_summary_uncached(self, kind: str, e: dict) -> str:
 
         if kind == "education":
 
@@ -9252,19 +10160,27 @@ class ResumeApp(ttk.Frame):
 
         new_idx = self._move_item_in_list(sections, from_idx, to_idx)
 
-        self.refresh_sections()
+        lo, hi = (from_idx, new_idx) if from_idx <= new_idx else (new_idx, from_idx)
+
+        for i in range(lo, hi + 1):
+
+            sec = sections[i]
+
+            self.sections_tree.item(str(i), values=(sec.get("title", ""), sec.get("kind", "")))
 
         try:
 
+            # Fires <<TreeviewSelect>>, so on_section_selected runs via
+
+            # the binding rather than a second direct call.
+
             self.sections_tree.selection_set(str(new_idx))
 
         except Exception:
 
             pass
 
-        self.on_section_selected(None)
-
-        self._update_undo_redo_buttons()
+        self._schedule_ui_sync()
 
 
 
@@ -9432,7 +10348,11 @@ class ResumeApp(ttk.Frame):
 
         new_idx = self._move_item_in_list(entries, from_idx, to_idx)
 
-        self.refresh_entries()
+        kind = sec.get("kind")
+
+        lo, hi = (from_idx, new_idx) if from_idx <= new_idx else (new_idx, from_idx)
+
+        self._rewrite_entry_rows(kind, entries, lo, hi + 1)
 
         try:
 
@@ -9444,7 +10364,7 @@ class ResumeApp(ttk.Frame):
 
         self._update_entry_action_buttons()
 
-        self._update_undo_redo_buttons()
+        self._schedule_ui_sync()
 
 
 
@@ -9500,7 +10420,7 @@ class ResumeApp(ttk.Frame):
 
             self._drag_tip_win.geometry(f"+{x}+{y}")
 
-        except Exception:
+        except tk.TclError:
 
             return
 
@@ -9516,7 +10436,7 @@ class ResumeApp(ttk.Frame):
 
             self._drag_tip_win.geometry(f"+{x}+{y}")
 
-        except Exception:
+        except tk.TclError:
 
             return
 
@@ -9530,7 +10450,7 @@ class ResumeApp(ttk.Frame):
 
                 self._drag_tip_win.destroy()
 
-        except Exception:
+        except tk.TclError:
 
             pass
 
@@ -9544,34 +10464,66 @@ class ResumeApp(ttk.Frame):
 
         header = self.data.setdefault("header", {})
 
-        for k, var in self.header_vars.items():
+        try:
 
-            try:
+            for k, var in self.header_vars.items():
 
                 header[k] = str(var.get() or "").strip()
 
-            except Exception:
+        except tk.TclError:
 
-                header[k] = ""
+            for k in self.header_vars:
 
+                header.setdefault(k, "")
 
 
-    def _update_header_link_field_states(self) -> None:
 
-        def _get_var(k: str) -> str:
+    def _refresh_header_link_ui(
 
-            try:
+        self,
 
-                v = self.header_vars.get(k)
+        linkedin_kind: Optional[str] = None,
 
-                return "" if v is None else str(v.get() or "")
+        github_kind: Optional[str] = None,
 
-            except Exception:
+    ) -> None:
 
-                return ""
+        if linkedin_kind is None:
+
+            linkedin_kind = _var_text(self.header_vars.get("linkedin_kind"))
+
+        if github_kind is None:
+
+            github_kind = _var_text(self.header_vars.get("github_kind"))
+
+
+
+        kinds = (linkedin_kind, github_kind)
+
+        if kinds == self._header_link_ui_kinds:
+
+            return
+
+        self._header_link_ui_kinds = kinds
+
+
+
+        self._update_header_link_field_states(linkedin_kind, github_kind)
+
+        self._update_header_platform_text_labels(linkedin_kind, github_kind)
 
 
 
+    def _update_header_link_field_states(
+
+        self,
+
+        linkedin_kind: Optional[str] = None,
+
+        github_kind: Optional[str] = None,
+
+    ) -> None:
+
         def _set_state(k: str, enabled: bool) -> None:
 
             w = self._header_widgets.get(k)
@@ -9588,7 +10540,7 @@ class ResumeApp(ttk.Frame):
 
                 return
 
-            except Exception:
+            except tk.TclError:
 
                 pass
 
@@ -9602,21 +10554,25 @@ class ResumeApp(ttk.Frame):
 
                     w.state(["disabled"])
 
-            except Exception:
+            except (AttributeError, tk.TclError):
 
                 return
 
 
 
-        linkedin_kind = _get_var("linkedin_kind").strip().lower()
+        if linkedin_kind is None:
 
-        github_kind = _get_var("github_kind").strip().lower()
+            linkedin_kind = _var_text(self.header_vars.get("linkedin_kind"))
 
+        if github_kind is None:
 
+            github_kind = _var_text(self.header_vars.get("github_kind"))
 
-        linkedin_enabled = linkedin_kind != "none"
 
-        github_enabled = github_kind != "none"
+
+        linkedin_enabled = linkedin_kind.strip().lower() != "none"
+
+        github_enabled = github_kind.strip().lower() != "none"
 
 
 
@@ -9630,21 +10586,15 @@ class ResumeApp(ttk.Frame):
 
 
 
-    def _update_header_platform_text_labels(self) -> None:
-
-        def _get_var(k: str) -> str:
-
-            try:
-
-                v = self.header_vars.get(k)
+    def _update_header_platform_text_labels(
 
-                return "" if v is None else str(v.get() or "")
-
-            except Exception:
+        self,
 
-                return ""
+        linkedin_kind: Optional[str] = None,
 
+        github_kind: Optional[str] = None,
 
+    ) -> None:
 
         def _platform_label(kind: str) -> str:
 
@@ -9658,153 +10608,447 @@ class ResumeApp(ttk.Frame):
 
                 return "Link Label"
 
-            return f"{k} Link Label"
+            return f"{k} Link Label"
+
+
+
+        def _set_label(display_key: str, txt: str) -> None:
+
+            try:
+
+                v = getattr(self, "_header_label_vars", {}).get(display_key)
+
+                if v is not None:
+
+                    v.set(txt)
+
+            except tk.TclError:
+
+                return
+
+
+
+        if linkedin_kind is None:
+
+            linkedin_kind = _var_text(self.header_vars.get("linkedin_kind"))
+
+        if github_kind is None:
+
+            github_kind = _var_text(self.header_vars.get("github_kind"))
+
+
+
+        _set_label("linkedin_display", _platform_label(linkedin_kind))
+
+        _set_label("github_display", _platform_label(github_kind))
+
+
+
+    def _snapshot_for_undo(self, state: dict) -> Any:
+
+        if jsonpatch is None:
+
+            return deep_copy(state)
+
+        if self._undo_baseline is None or self._undo_ops_since_baseline >= 25:
+
+            self._undo_baseline = deep_copy(state)
+
+            self._undo_ops_since_baseline = 0
+
+            return (self._undo_baseline, None)
+
+        self._undo_ops_since_baseline += 1
+
+        patch = jsonpatch.make_patch(self._undo_baseline, state)
+
+        # make_patch stores op values that alias subtrees of the live state;
+
+        # freeze them, or later in-place edits would silently rewrite patches
+
+        # already sitting in the undo/redo stacks.
+
+        return (self._undo_baseline, jsonpatch.JsonPatch(deep_copy(patch.patch)))
+
+
+
+    def _restore_undo_snapshot(self, snap: Any) -> dict:
+
+        # Always returns a state the caller owns outright. Plain snapshots are
+
+        # popped off the stack (sole reference), but patch.apply shares both
+
+        # baseline subtrees and patch values with its result, so the
+
+        # delta-compressed cases need a real copy before the caller adopts
+
+        # the tree as mutable state.
+
+        if isinstance(snap, tuple):
+
+            baseline, patch = snap
+
+            if patch is None:
+
+                return deep_copy(baseline)
+
+            return deep_copy(patch.apply(baseline, in_place=False))
+
+        return snap
+
+
+
+    def _push_undo_snapshot(self, snapshot: dict) -> None:
+
+        self.undo_stack.append(self._snapshot_for_undo(snapshot))
+
+        self.redo_stack.clear()
+
+        self._schedule_ui_sync()
+
+
+
+    def _show_toast(self, message: str) -> None:
+
+        # Non-blocking status note; replaces modal confirmations for
+
+        # actions that are already undoable.
+
+        if self._toast_label is None:
+
+            self._toast_label = ttk.Label(self, anchor="w", padding=(8, 2))
+
+        self._toast_label.configure(text=message)
+
+        self._toast_label.pack(side=tk.BOTTOM, fill=tk.X)
+
+        if self._toast_job is not None:
+
+            try:
+
+                self.after_cancel(self._toast_job)
+
+            except Exception:
+
+                pass
+
+        self._toast_job = self.after(3000, self._hide_toast)
+
+    def _hide_toast(self) -> None:
+
+        self._toast_job = None
+
+        if self._toast_label is not None:
+
+            self._toast_label.pack_forget()
+
+    @contextmanager
+
+    def _batch(self):
+
+        """Group several mutations under one checkpoint and one redraw.
+
+        While the block runs, refresh_sections/refresh_entries early-return
+
+        and the entries tree is unpacked so Tk does no per-row relayout;
+
+        both trees are rebuilt once on exit.
+
+        """
+
+        self._checkpoint_before_change()
+
+        self._suspend_refresh = True
+
+        self.entries_tree.pack_forget()
+
+        try:
+
+            yield
+
+        finally:
+
+            self._suspend_refresh = False
+
+            self.entries_tree.pack(fill=tk.BOTH, expand=True)
+
+            self.refresh_sections()
+
+    def _checkpoint_before_change(self, path: Optional[Tuple[Any, ...]] = None) -> None:
+
+        if self._suspend_refresh:
+
+            return
+
+        self._commit_header_typing()
+
+        self.sync_header_from_ui()
+
+        if path is not None:
+
+            # Scoped edit: record just the about-to-change subtree instead
+
+            # of snapshotting (and later diffing) the whole document.
+
+            self.undo_stack.append(EditCommand(path, deep_copy(_get_at_path(self.data, path))))
+
+            self.redo_stack.clear()
+
+            self._schedule_ui_sync()
+
+        else:
+
+            self._push_undo_snapshot(self.data)
+
+        self._schedule_session_autosave()
+
+
+
+    def _cancel_pending_checkpoint_job(self) -> None:
+
+        if self._pending_checkpoint_job is not None:
+
+            try:
+
+                self.master.after_cancel(self._pending_checkpoint_job)
+
+            except Exception:
+
+                pass
+
+            self._pending_checkpoint_job = None
+
+
+
+    def _clear_header_typing_state(self) -> None:
+
+        self._cancel_pending_checkpoint_job()
+
+        self._pending_checkpoint_source = None
+
+
+
+    def _commit_pending_checkpoint(self) -> None:
+
+        self._cancel_pending_checkpoint_job()
+
+        if self._pending_checkpoint_source is not None:
+
+            self._sync_dirty_header_keys()
+
+            self._pending_checkpoint_source = None
+
+
+
+    def _sync_dirty_header_keys(self) -> None:
+
+        # Only read back the vars whose traces actually fired; each get()
+
+        # is a Tcl round-trip, so a full sync on every commit is wasteful.
+
+        if not self._dirty_header_keys:
+
+            self.sync_header_from_ui()
+
+            return
+
+        header = self.data.setdefault("header", {})
+
+        try:
+
+            for k in self._dirty_header_keys:
+
+                var = self.header_vars.get(k)
+
+                if var is not None:
+
+                    header[k] = str(var.get() or "").strip()
+
+        except tk.TclError:
+
+            pass
+
+        self._dirty_header_keys.clear()
+
+
+
+    def _commit_header_typing(self) -> None:
+
+        self._commit_pending_checkpoint()
+
+
+
+    def _schedule_undo_checkpoint(self, source_key: str, delay_ms: int = 600) -> None:
+
+        # One undo entry per burst of continuous typing: the pre-change
+
+        # state is snapshotted on the first keystroke from a given source,
+
+        # then the commit is pushed out while keystrokes keep arriving.
+
+        if self._suspend_undo:
+
+            return
+
+
 
+        self._schedule_session_autosave()
 
 
-        def _set_label(display_key: str, txt: str) -> None:
 
-            try:
+        if self._pending_checkpoint_source == source_key and self._pending_checkpoint_job is not None:
 
-                v = getattr(self, "_header_label_vars", {}).get(display_key)
+            return
 
-                if v is not None:
 
-                    v.set(txt)
 
-            except Exception:
+        if self._pending_checkpoint_source is not None:
 
-                return
+            self._commit_pending_checkpoint()
 
 
 
-        linkedin_kind = _get_var("linkedin_kind").strip().lower()
+        self._push_undo_snapshot(self.data)
 
-        github_kind = _get_var("github_kind").strip().lower()
+        self._pending_checkpoint_source = source_key
 
+        self._pending_checkpoint_job = self.master.after(delay_ms, self._commit_pending_checkpoint)
 
 
-        _set_label("linkedin_display", _platform_label(_get_var("linkedin_kind")))
 
-        _set_label("github_display", _platform_label(_get_var("github_kind")))
+    def _on_header_var_changed(self, key: Optional[str] = None) -> None:
 
+        if key is not None:
 
+            self._dirty_header_keys.add(key)
 
-    def _push_undo_snapshot(self, snapshot: dict) -> None:
+        self._schedule_undo_checkpoint("header")
 
-        self.undo_stack.append(deep_copy(snapshot))
 
-        if len(self.undo_stack) > 100:
 
-            self.undo_stack.pop(0)
+    def _sections_before_edit(self, path: Tuple[Any, ...], old_value: Any) -> list:
 
-        self.redo_stack.clear()
+        # Rebuild the sections list as it looked before a scoped EditCommand
 
-        self._update_undo_redo_buttons()
+        # mutation: identical to the live tree except at the edited path.
 
+        sections = self.data.get("sections", []) if isinstance(self.data, dict) else []
 
+        if not isinstance(sections, list):
 
-    def _checkpoint_before_change(self) -> None:
+            return []
 
-        self._commit_header_typing()
+        if path == ("sections",):
 
-        self.sync_header_from_ui()
+            return old_value if isinstance(old_value, list) else []
 
-        self._push_undo_snapshot(self.data)
+        if len(path) == 2 and path[0] == "sections":
 
-        self._schedule_session_autosave()
+            out = list(sections)
 
+            if isinstance(path[1], int) and 0 <= path[1] < len(out):
 
+                out[path[1]] = old_value
 
-    def _clear_header_typing_state(self) -> None:
+            return out
 
-        if self._header_commit_job is not None:
+        if len(path) == 3 and path[0] == "sections" and path[2] == "entries":
 
-            try:
+            out = list(sections)
 
-                self.master.after_cancel(self._header_commit_job)
+            if isinstance(path[1], int) and 0 <= path[1] < len(out) and isinstance(out[path[1]], dict):
 
-            except Exception:
+                sec = dict(out[path[1]])
 
-                pass
+                sec["entries"] = old_value
 
-        self._header_commit_job = None
+                out[path[1]] = sec
 
-        self._header_typing_in_progress = False
+            return out
 
+        return []
 
 
-    def _commit_header_typing(self) -> None:
 
-        if self._header_commit_job is not None:
+    def _refresh_trees_fast(self, old_sections: list) -> None:
 
-            try:
+        sections = self.data.get("sections", [])
 
-                self.master.after_cancel(self._header_commit_job)
+        if not isinstance(sections, list) or len(sections) != len(self.sections_tree.get_children("")):
 
-            except Exception:
+            self.refresh_sections()
 
-                pass
+            return
 
-            self._header_commit_job = None
 
 
+        for i, sec in enumerate(sections):
 
-        if self._header_typing_in_progress:
+            vals = (sec.get("title", ""), sec.get("kind", ""))
 
-            self.sync_header_from_ui()
+            old = old_sections[i] if i < len(old_sections) else None
 
-            self._header_typing_in_progress = False
+            if not isinstance(old, dict) or (old.get("title", ""), old.get("kind", "")) != vals:
 
+                self.sections_tree.item(str(i), values=vals)
 
 
-    def _on_header_var_changed(self) -> None:
 
-        if self._suspend_undo:
+        sidx = self._selected_section_index()
 
-            return
+        if sidx < 0 or sidx >= len(sections):
 
+            self.refresh_sections()
 
+            return
 
-        if not self._header_typing_in_progress:
 
-            self._push_undo_snapshot(self.data)
 
-            self._header_typing_in_progress = True
+        sec = sections[sidx]
 
+        kind = sec.get("kind")
 
+        entries = sec.get("entries", []) or []
 
-        self._schedule_session_autosave()
+        if not isinstance(entries, list) or len(entries) != len(self.entries_tree.get_children("")):
 
+            self.refresh_entries()
 
+            return
 
-        if self._header_commit_job is not None:
 
-            try:
 
-                self.master.after_cancel(self._header_commit_job)
+        old_sec = old_sections[sidx] if sidx < len(old_sections) else None
 
-            except Exception:
+        old_entries = (old_sec.get("entries") if isinstance(old_sec, dict) else None) or []
 
-                pass
+        for i, e in enumerate(entries):
 
-            self._header_commit_job = None
+            if i < len(old_entries) and old_entries[i] == e:
 
+                continue
 
+            self.entries_tree.item(str(i), values=(self._entry_summary(kind, e),))
 
-        self._header_commit_job = self.master.after(600, self._commit_header_typing)
+        self._update_entry_action_buttons()
 
 
 
-    def _apply_state(self, state: dict) -> None:
+    def _apply_state(self, state: dict, *, owned: bool = False, fast: bool = False, old_sections: Optional[list] = None) -> None:
 
         self._clear_header_typing_state()
 
+        self._row_cache.clear()
+
         self._suspend_undo = True
 
         try:
 
-            st = deep_copy(state)
+            if old_sections is None:
+
+                old_sections = self.data.get("sections", []) if isinstance(self.data, dict) else []
+
+            st = state if owned else deep_copy(state)
 
             try:
 
@@ -9822,9 +11066,15 @@ class ResumeApp(ttk.Frame):
 
             self.data = st
 
+            header = self.data.get("header", {})
+
             for k, var in self.header_vars.items():
 
-                var.set(str(self.data.get("header", {}).get(k, "")))
+                new_val = str(header.get(k, ""))
+
+                if var.get() != new_val:
+
+                    var.set(new_val)
 
 
 
@@ -9836,7 +11086,11 @@ class ResumeApp(ttk.Frame):
 
                     if v is not None:
 
-                        self._header_last_kind[k] = str(v.get() or "")
+                        new_kind = str(v.get() or "")
+
+                        if self._header_last_kind.get(k) != new_kind:
+
+                            self._header_last_kind[k] = new_kind
 
             except Exception:
 
@@ -9844,19 +11098,27 @@ class ResumeApp(ttk.Frame):
 
 
 
-            self._update_header_link_field_states()
+            self._refresh_header_link_ui()
 
-            self._update_header_platform_text_labels()
+            if fast:
 
-            self.refresh_sections()
+                self._refresh_trees_fast(old_sections if isinstance(old_sections, list) else [])
 
-            try:
+            else:
 
-                self.master.update_idletasks()
+                self.refresh_sections()
 
-            except Exception:
+                # Single trailing idle flush; never update(), and never
 
-                pass
+                # mid-refresh, to avoid flicker and re-measures.
+
+                try:
+
+                    self.master.update_idletasks()
+
+                except Exception:
+
+                    pass
 
         finally:
 
@@ -9864,15 +11126,43 @@ class ResumeApp(ttk.Frame):
 
 
 
+    def _schedule_ui_sync(self) -> None:
+
+        # Coalesce undo/redo button updates: many edits in one event-loop
+
+        # tick cost a single configure round-trip to Tcl.
+
+        if self._ui_sync_pending:
+
+            return
+
+        self._ui_sync_pending = True
+
+        self.after_idle(self._flush_ui_sync)
+
+
+
+    def _flush_ui_sync(self) -> None:
+
+        self._ui_sync_pending = False
+
+        self._update_undo_redo_buttons()
+
+
+
     def _update_undo_redo_buttons(self) -> None:
 
-        if hasattr(self, "btn_undo"):
+        btn = getattr(self, "btn_undo", None)
+
+        if btn is not None and btn.winfo_exists():
 
-            self.btn_undo.configure(state=("normal" if self.undo_stack else "disabled"))
+            btn.configure(state=("normal" if self.undo_stack else "disabled"))
 
-        if hasattr(self, "btn_redo"):
+        btn = getattr(self, "btn_redo", None)
 
-            self.btn_redo.configure(state=("normal" if self.redo_stack else "disabled"))
+        if btn is not None and btn.winfo_exists():
+
+            btn.configure(state=("normal" if self.redo_stack else "disabled"))
 
 
 
@@ -9918,15 +11208,35 @@ class ResumeApp(ttk.Frame):
 
             return
 
-        current = deep_copy(self.data)
+        snap = self.undo_stack.pop()
 
-        prev = self.undo_stack.pop()
+        if isinstance(snap, EditCommand):
 
-        self.redo_stack.append(current)
+            current = deep_copy(_get_at_path(self.data, snap.path))
 
-        self._apply_state(prev)
+            self.redo_stack.append(EditCommand(snap.path, current))
 
-        self._update_undo_redo_buttons()
+            # Capture what the trees currently show before mutating, so the
+
+            # fast refresh diffs against the pre-restore state.
+
+            old_sections = self._sections_before_edit(snap.path, current)
+
+            _set_at_path(self.data, snap.path, snap.old)
+
+            self._apply_state(self.data, owned=True, fast=True, old_sections=old_sections)
+
+        else:
+
+            current = self._snapshot_for_undo(self.data)
+
+            prev = self._restore_undo_snapshot(snap)
+
+            self.redo_stack.append(current)
+
+            self._apply_state(prev, owned=True, fast=True)
+
+        self._schedule_ui_sync()
 
         self._schedule_session_autosave()
 
@@ -9942,15 +11252,31 @@ class ResumeApp(ttk.Frame):
 
             return
 
-        current = deep_copy(self.data)
+        snap = self.redo_stack.pop()
 
-        nxt = self.redo_stack.pop()
+        if isinstance(snap, EditCommand):
 
-        self.undo_stack.append(current)
+            current = deep_copy(_get_at_path(self.data, snap.path))
 
-        self._apply_state(nxt)
+            self.undo_stack.append(EditCommand(snap.path, current))
 
-        self._update_undo_redo_buttons()
+            old_sections = self._sections_before_edit(snap.path, current)
+
+            _set_at_path(self.data, snap.path, snap.old)
+
+            self._apply_state(self.data, owned=True, fast=True, old_sections=old_sections)
+
+        else:
+
+            current = self._snapshot_for_undo(self.data)
+
+            nxt = self._restore_undo_snapshot(snap)
+
+            self.undo_stack.append(current)
+
+            self._apply_state(nxt, owned=True, fast=True)
+
+        self._schedule_ui_sync()
 
         self._schedule_session_autosave()
 
@@ -9990,49 +11316,39 @@ class ResumeApp(ttk.Frame):
 
 
 
-    def _bind_undo_redo_shortcuts(self) -> None:
-
-        self.master.bind_all(
-
-            "<Control-z>", lambda e: self._handle_undo_shortcut(e, "undo"), add="+"
-
-        )
-
-        self.master.bind_all(
-
-            "<Control-y>", lambda e: self._handle_undo_shortcut(e, "redo"), add="+"
+    def _global_key_dispatch(self, event):
 
-        )
+        # Control everywhere; Command maps to Mod1 (0x8) under aqua Tk.
 
-        self.master.bind_all(
+        state = int(getattr(event, "state", 0) or 0)
 
-            "<Control-Shift-z>", lambda e: self._handle_undo_shortcut(e, "redo"), add="+"
+        mod_mask = 0x8 if sys.platform == "darwin" else 0x4
 
-        )
+        if not (state & mod_mask):
 
-        self.master.bind_all(
+            return None
 
-            "<Command-z>", lambda e: self._handle_undo_shortcut(e, "undo"), add="+"
+        keysym = str(getattr(event, "keysym", "")).lower()
 
-        )
+        if keysym == "z":
 
-        self.master.bind_all(
+            return self._handle_undo_shortcut(event, "redo" if state & 0x1 else "undo")
 
-            "<Command-y>", lambda e: self._handle_undo_shortcut(e, "redo"), add="+"
+        if keysym == "y":
 
-        )
+            return self._handle_undo_shortcut(event, "redo")
 
-        self.master.bind_all(
+        if keysym == "s":
 
-            "<Command-Shift-z>", lambda e: self._handle_undo_shortcut(e, "redo"), add="+"
+            return self._handle_save_shortcut(event)
 
-        )
+        return None
 
 
 
-        self.master.bind_all("<Control-KeyPress-s>", self._handle_save_shortcut, add="+")
+    def _bind_undo_redo_shortcuts(self) -> None:
 
-        self.master.bind_all("<Command-KeyPress-s>", self._handle_save_shortcut, add="+")
+        self.master.bind_all("<Key>", self._global_key_dispatch, add="+")
 
 
 
@@ -10128,19 +11444,17 @@ class ResumeApp(ttk.Frame):
 
         try:
 
-            with open(path, "w", encoding="utf-8") as f:
+            payload = dict(self.data)
 
-                payload = deep_copy(self.data)
-
-                try:
+            try:
 
-                    payload["spellcheck_ignore_all"] = self.spellcheck_manager.get_ignore_all()
+                payload["spellcheck_ignore_all"] = self.spellcheck_manager.get_ignore_all()
 
-                except Exception:
+            except Exception:
 
-                    pass
+                pass
 
-                json.dump(payload, f, indent=2, ensure_ascii=False)
+            _write_json_file(path, payload)
 
         except Exception as e:
 
@@ -10170,19 +11484,17 @@ class ResumeApp(ttk.Frame):
 
         try:
 
-            with open(self.current_project_path, "w", encoding="utf-8") as f:
-
-                payload = deep_copy(self.data)
+            payload = dict(self.data)
 
-                try:
+            try:
 
-                    payload["spellcheck_ignore_all"] = self.spellcheck_manager.get_ignore_all()
+                payload["spellcheck_ignore_all"] = self.spellcheck_manager.get_ignore_all()
 
-                except Exception:
+            except Exception:
 
-                    pass
+                pass
 
-                json.dump(payload, f, indent=2, ensure_ascii=False)
+            _write_json_file(self.current_project_path, payload)
 
         except Exception as e:
 
@@ -10204,7 +11516,7 @@ class ResumeApp(ttk.Frame):
 
         self._apply_state(data)
 
-        self._update_undo_redo_buttons()
+        self._schedule_ui_sync()
 
         self._mark_session_saved()
 
@@ -10232,9 +11544,7 @@ class ResumeApp(ttk.Frame):
 
         try:
 
-            with open(path, "r", encoding="utf-8") as f:
-
-                raw = json.load(f)
+            raw = _read_json_file(path)
 
         except Exception as e:
 
@@ -10270,27 +11580,29 @@ class ResumeApp(ttk.Frame):
 
 
 
-        self._checkpoint_before_change()
+        # _batch takes the checkpoint, suppresses the per-selection-change
 
+        # entry refreshes and _apply_state's own rebuild, and redraws both
 
+        # trees once on exit.
 
-        try:
+        with self._batch():
 
-            for iid in self.sections_tree.selection():
+            try:
 
-                self.sections_tree.selection_remove(iid)
+                for iid in self.sections_tree.selection():
 
-        except Exception:
+                    self.sections_tree.selection_remove(iid)
 
-            pass
+            except Exception:
 
+                pass
 
 
-        self._apply_state(data)
 
-        self._update_undo_redo_buttons()
+            self._apply_state(data)
 
-        self.refresh_sections()
+        self._schedule_ui_sync()
 
         self.current_project_path = path
 
@@ -10308,9 +11620,11 @@ class ResumeApp(ttk.Frame):
 
 
 
+        sections = self.data.get("sections") or []
+
         try:
 
-            total_entries = sum(len(sec.get("entries", []) or []) for sec in (self.data.get("sections", []) or []) if isinstance(sec, dict))
+            total_entries = sum(len(sec.get("entries") or []) for sec in sections if isinstance(sec, dict))
 
         except Exception:
 
@@ -10318,7 +11632,11 @@ class ResumeApp(ttk.Frame):
 
 
 
-        h = self.data.get("header", {}) if isinstance(self.data.get("header"), dict) else {}
+        h = self.data.get("header")
+
+        if not isinstance(h, dict):
+
+            h = {}
 
         name_preview = str(h.get("name", ""))
 
@@ -10360,7 +11678,7 @@ class ResumeApp(ttk.Frame):
 
             "Loaded",
 
-            f"Loaded from {path}\n\nName: {name_preview}\nEmail: {email_preview}\nSections: {len(self.data.get('sections', []) or [])}\nEntries: {total_entries}\n\nUI Name: {ui_name}\nUI Email: {ui_email}\nUI Sections: {ui_sections}\nUI Entries: {ui_entries}",
+            f"Loaded from {path}\n\nName: {name_preview}\nEmail: {email_preview}\nSections: {len(sections)}\nEntries: {total_entries}\n\nUI Name: {ui_name}\nUI Email: {ui_email}\nUI Sections: {ui_sections}\nUI Entries: {ui_entries}",
 
         )
 
@@ -10406,11 +11724,17 @@ class ResumeApp(ttk.Frame):
 
         try:
 
-            latex_source = generate_latex(self.data)
+            # Stream line-by-line into the temp file so the whole document
+
+            # never has to exist as one string, then swap it into place.
 
-            with open(path, "w", encoding="utf-8") as f:
+            tmp_path = path + ".tmp"
 
-                f.write(latex_source)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+
+                generate_latex_stream(self.data, f)
+
+            os.replace(tmp_path, path)
 
         except Exception as e:
 
@@ -10424,6 +11748,42 @@ class ResumeApp(ttk.Frame):
 
 
 
+    def _submit_export(self, work: Callable[[], None], path: str) -> None:
+
+        # Run the heavy build/save phase off the Tk main thread so the UI
+
+        # stays responsive; results come back through the event loop.
+
+        if self._export_executor is None:
+
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._export_executor = ThreadPoolExecutor(max_workers=1)
+
+
+
+        def _run() -> None:
+
+            try:
+
+                work()
+
+            except Exception as e:
+
+                err = str(e)
+
+                self.after(0, lambda: messagebox.showerror("Export Failed", err))
+
+                return
+
+            self.after(0, lambda: messagebox.showinfo("Exported", f"Wrote {path}"))
+
+
+
+        self._export_executor.submit(_run)
+
+
+
     def export_as_docx(self):
 
         self._commit_header_typing()
@@ -10464,6 +11824,10 @@ class ResumeApp(ttk.Frame):
 
             from docx.shared import Inches, Pt, RGBColor
 
+
+
+            from docx.table import Table as DocxTable
+
         except Exception:
 
             messagebox.showerror(
@@ -10484,22 +11848,6 @@ class ResumeApp(ttk.Frame):
 
 
 
-        def _norm_hex_color(c: Any) -> Optional[str]:
-
-            s = ("" if c is None else str(c)).strip()
-
-            if not s:
-
-                return None
-
-            if re.fullmatch(r"#?[0-9a-fA-F]{6}", s):
-
-                return ("#" + s.lstrip("#")).lower()
-
-            return None
-
-
-
         def _hex_to_rgb(c: Any) -> Optional[RGBColor]:
 
             s = _norm_hex_color(c)
@@ -10620,69 +11968,53 @@ class ResumeApp(ttk.Frame):
 
 
 
-        def _map_docx_font(face: Any) -> str:
-
-            f = ("" if face is None else str(face)).strip().lower()
-
-            if not f:
+        def segments_to_plain(segments: Any) -> str:
 
-                return "Times New Roman"
+            if not isinstance(segments, list):
 
-            if "courier" in f or "mono" in f:
+                return ""
 
-                return "Courier New"
+            return "".join(
 
-            if "arial" in f or "helvetica" in f or "sans" in f:
+                seg.get("text", "")
 
-                return "Arial"
+                for seg in segments
 
-            if "times" in f or "serif" in f or "georgia" in f:
+                if isinstance(seg, dict) and isinstance(seg.get("text"), str)
 
-                return "Times New Roman"
+            )
 
-            return "Times New Roman"
 
 
+        def _has_any_text(segments: Any) -> bool:
 
-        def segments_to_plain(segments: Any) -> str:
+            # Cheap emptiness probe: bails on the first non-empty segment
 
-            if not isinstance(segments, list):
+            # instead of materializing the joined plain text.
 
-                return ""
+            if isinstance(segments, str):
 
-            parts: List[str] = []
+                return bool(segments)
 
-            for seg in segments:
+            if not isinstance(segments, list):
 
-                if isinstance(seg, dict):
+                return False
 
-                    t = seg.get("text", "")
+            return any(
 
-                    if isinstance(t, str) and t:
+                isinstance(seg, dict) and isinstance(seg.get("text"), str) and seg.get("text")
 
-                        parts.append(t)
+                for seg in segments
 
-            return "".join(parts)
+            )
 
 
 
         def _strip_bullet_prefix(segments: Any) -> Any:
 
-            prefixes = ("- ", "– ", "— ", "• ", "* ")
-
-
-
             if isinstance(segments, str):
 
-                s = segments.lstrip()
-
-                for p in prefixes:
-
-                    if s.startswith(p):
-
-                        return s[len(p) :].lstrip()
-
-                return s
+                return _BULLET_PREFIX_RE.sub("", segments.lstrip(), count=1)
 
 
 
@@ -10704,19 +12036,9 @@ class ResumeApp(ttk.Frame):
 
                     if isinstance(t, str) and t:
 
-                        s = t.lstrip()
-
-                        for p in prefixes:
-
-                            if s.startswith(p):
-
-                                s = s[len(p) :].lstrip()
-
-                                break
-
                         new_seg = dict(seg)
 
-                        new_seg["text"] = s
+                        new_seg["text"] = _BULLET_PREFIX_RE.sub("", t.lstrip(), count=1)
 
                         out.append(new_seg)
 
@@ -10726,17 +12048,7 @@ class ResumeApp(ttk.Frame):
 
                 if not stripped and isinstance(seg, str) and seg:
 
-                    s = seg.lstrip()
-
-                    for p in prefixes:
-
-                        if s.startswith(p):
-
-                            s = s[len(p) :].lstrip()
-
-                            break
-
-                    out.append(s)
+                    out.append(_BULLET_PREFIX_RE.sub("", seg.lstrip(), count=1))
 
                     stripped = True
 
@@ -10764,7 +12076,9 @@ class ResumeApp(ttk.Frame):
 
                     continue
 
-                t = seg.get("text", "")
+                get = seg.get
+
+                t = get("text", "")
 
                 if not isinstance(t, str) or t == "":
 
@@ -10772,33 +12086,49 @@ class ResumeApp(ttk.Frame):
 
                 run = p.add_run(t)
 
-                run.bold = bool(seg.get("b"))
+                # Only touch properties that deviate from the default: every
+
+                # assignment goes through python-docx's oxml setters and adds
+
+                # rPr children, so plain runs should stay untouched.
+
+                if get("b"):
+
+                    run.bold = True
+
+                if get("i"):
+
+                    run.italic = True
+
+                if get("u"):
 
-                run.italic = bool(seg.get("i"))
+                    run.underline = True
 
-                run.underline = bool(seg.get("u"))
+                font = get("font")
 
-                if seg.get("font"):
+                if font:
 
                     try:
 
-                        run.font.name = _map_docx_font(seg.get("font"))
+                        run.font.name = _map_docx_font(font)
 
                     except Exception:
 
                         pass
 
-                if seg.get("size"):
+                size = get("size")
+
+                if size:
 
                     try:
 
-                        run.font.size = Pt(float(seg.get("size")))
+                        run.font.size = Pt(float(size))
 
                     except Exception:
 
                         pass
 
-                rgb = _hex_to_rgb(seg.get("fg"))
+                rgb = _hex_to_rgb(get("fg"))
 
                 if rgb is not None:
 
@@ -10810,7 +12140,7 @@ class ResumeApp(ttk.Frame):
 
                         pass
 
-                _apply_run_bg(run, seg.get("bg"))
+                _apply_run_bg(run, get("bg"))
 
 
 
@@ -10836,19 +12166,19 @@ class ResumeApp(ttk.Frame):
 
         header = self.data.get("header", {}) if isinstance(self.data.get("header"), dict) else {}
 
-        name = str(header.get("name", "")).strip()
+        name = _s(header.get("name"))
 
-        phone = str(header.get("phone", "")).strip()
+        phone = _s(header.get("phone"))
 
-        email = str(header.get("email", "")).strip()
+        email = _s(header.get("email"))
 
         linkedin_kind = str(header.get("linkedin_kind", "LinkedIn") or "").strip()
 
         github_kind = str(header.get("github_kind", "GitHub") or "").strip()
 
-        linkedin = "" if linkedin_kind.lower() == "none" else str(header.get("linkedin", "")).strip()
+        linkedin = "" if linkedin_kind.lower() == "none" else _s(header.get("linkedin"))
 
-        github = "" if github_kind.lower() == "none" else str(header.get("github", "")).strip()
+        github = "" if github_kind.lower() == "none" else _s(header.get("github"))
 
 
 
@@ -10886,47 +12216,31 @@ class ResumeApp(ttk.Frame):
 
 
 
-        if name:
-
-            p = doc.add_paragraph()
-
-            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-            r = p.add_run(_sanitize_text(name))
-
-            r.bold = True
-
-            r.font.size = Pt(22)
-
-            r.font.name = "Times New Roman"
-
-
+        if name:
 
-        contact_parts: List[str] = []
+            p = doc.add_paragraph()
 
-        if phone:
+            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
-            contact_parts.append(phone)
+            r = p.add_run(_sanitize_text(name))
 
-        if email:
+            r.bold = True
 
-            contact_parts.append(email)
+            r.font.size = Pt(22)
 
-        if linkedin:
+            r.font.name = "Times New Roman"
 
-            contact_parts.append(linkedin)
 
-        if github:
 
-            contact_parts.append(github)
+        contact = " | ".join(s for s in (phone, email, linkedin, github) if s)
 
-        if contact_parts:
+        if contact:
 
             p = doc.add_paragraph()
 
             p.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
-            r = p.add_run(" | ".join([_sanitize_text(x) for x in contact_parts]))
+            r = p.add_run(contact)
 
             r.font.size = Pt(9.5)
 
@@ -10960,9 +12274,55 @@ class ResumeApp(ttk.Frame):
 
         indent_in = 0.15
 
+        # Length objects are tiny but were being re-constructed for every
 
+        # paragraph in the entry loop; build the fixed ones once.
 
-        def _add_two_col(left_text: Optional[str], right_text: Optional[str], *, left_bold: bool = False, left_italic: bool = False, right_italic: bool = False, left_runs: Any = None) -> None:
+        indent_left = Inches(indent_in)
+
+        space_pt0 = Pt(0)
+
+        space_pt3 = Pt(3)
+
+        space_pt4 = Pt(4)
+
+
+
+        two_col_template = None
+
+
+
+        def _new_two_col_table():
+
+            # The first table is built and styled normally; every later row
+
+            # clones its XML subtree, skipping the border/width/paragraph
+
+            # configuration round-trips.
+
+            nonlocal two_col_template
+
+            if two_col_template is not None:
+
+                new_tbl = copy.deepcopy(two_col_template)
+
+                body = doc.element.body
+
+                sect_pr = body.sectPr
+
+                if sect_pr is not None:
+
+                    # Land the clone where add_table would put it; nothing may
+
+                    # follow w:sectPr in a valid body.
+
+                    sect_pr.addprevious(new_tbl)
+
+                else:
+
+                    body.append(new_tbl)
+
+                return DocxTable(new_tbl, doc)
 
             t = doc.add_table(rows=1, cols=2)
 
@@ -10980,15 +12340,9 @@ class ResumeApp(ttk.Frame):
 
                 pass
 
+            p0 = t.cell(0, 0).paragraphs[0]
 
-
-            c0 = t.cell(0, 0)
-
-            c1 = t.cell(0, 1)
-
-            p0 = c0.paragraphs[0]
-
-            p1 = c1.paragraphs[0]
+            p1 = t.cell(0, 1).paragraphs[0]
 
             p0.alignment = WD_ALIGN_PARAGRAPH.LEFT
 
@@ -10996,14 +12350,30 @@ class ResumeApp(ttk.Frame):
 
             try:
 
-                p0.paragraph_format.space_after = Pt(0)
+                p0.paragraph_format.space_after = space_pt0
 
-                p1.paragraph_format.space_after = Pt(0)
+                p1.paragraph_format.space_after = space_pt0
 
             except Exception:
 
                 pass
 
+            # Snapshot the pristine XML before any runs are added to it.
+
+            two_col_template = copy.deepcopy(t._tbl)
+
+            return t
+
+
+
+        def _add_two_col(left_text: Optional[str], right_text: Optional[str], *, left_bold: bool = False, left_italic: bool = False, right_italic: bool = False, left_runs: Any = None) -> None:
+
+            t = _new_two_col_table()
+
+            p0 = t.cell(0, 0).paragraphs[0]
+
+            p1 = t.cell(0, 1).paragraphs[0]
+
 
 
             if left_runs is not None:
@@ -11054,7 +12424,7 @@ class ResumeApp(ttk.Frame):
 
                 p.paragraph_format.space_before = Pt(6)
 
-                p.paragraph_format.space_after = Pt(3)
+                p.paragraph_format.space_after = space_pt3
 
             except Exception:
 
@@ -11062,17 +12432,21 @@ class ResumeApp(ttk.Frame):
 
 
 
-        for section in self.data.get("sections", []) or []:
+        sections = self.data.get("sections") or []
+
+        for section in sections:
 
             if not isinstance(section, dict):
 
                 continue
 
-            title = str(section.get("title", "")).strip()
+            get = section.get
+
+            title = _s(get("title"))
 
-            kind = str(section.get("kind", "") or "").strip().lower()
+            kind = _s(get("kind")).lower()
 
-            raw_entries = section.get("entries", []) or []
+            raw_entries = get("entries") or []
 
             entries = raw_entries if isinstance(raw_entries, list) else []
 
@@ -11094,13 +12468,13 @@ class ResumeApp(ttk.Frame):
 
                 if kind == "education":
 
-                    school = str(e.get("school", "")).strip()
+                    school = _s(e.get("school"))
 
-                    location = str(e.get("location", "")).strip()
+                    location = _s(e.get("location"))
 
-                    degree = str(e.get("degree", "")).strip()
+                    degree = _s(e.get("degree"))
 
-                    dates = str(e.get("dates", "")).strip()
+                    dates = _s(e.get("dates"))
 
 
 
@@ -11112,23 +12486,15 @@ class ResumeApp(ttk.Frame):
 
                     body = e.get("body", [])
 
-                    body_text = segments_to_plain(body)
-
-                    if body_text:
+                    if _has_any_text(body):
 
                         p = add_rich_paragraph(doc, _strip_bullet_prefix(body), bullet=True)
 
-                        try:
-
-                            p.paragraph_format.left_indent = Inches(indent_in)
-
-                        except Exception:
-
-                            pass
+                        p.paragraph_format.left_indent = indent_left
 
                     try:
 
-                        doc.add_paragraph().paragraph_format.space_after = Pt(3)
+                        doc.add_paragraph().paragraph_format.space_after = space_pt3
 
                     except Exception:
 
@@ -11140,13 +12506,13 @@ class ResumeApp(ttk.Frame):
 
                     if kind == "experience":
 
-                        role = str(e.get("role", "")).strip()
+                        role = _s(e.get("role"))
 
-                        org = str(e.get("org", "")).strip()
+                        org = _s(e.get("org"))
 
-                        location = str(e.get("location", "")).strip()
+                        location = _s(e.get("location"))
 
-                        dates = str(e.get("dates", "")).strip()
+                        dates = _s(e.get("dates"))
 
                         _add_two_col(role, dates, left_bold=True)
 
@@ -11154,11 +12520,11 @@ class ResumeApp(ttk.Frame):
 
                     else:
 
-                        proj_title = str(e.get("title", "")).strip()
+                        proj_title = _s(e.get("title"))
 
-                        stack = str(e.get("stack", "")).strip()
+                        stack = _s(e.get("stack"))
 
-                        dates = str(e.get("dates", "")).strip()
+                        dates = _s(e.get("dates"))
 
                         left_runs: List[dict] = []
 
@@ -11186,17 +12552,11 @@ class ResumeApp(ttk.Frame):
 
                             p = add_rich_paragraph(doc, _strip_bullet_prefix(b), bullet=True)
 
-                            try:
-
-                                p.paragraph_format.left_indent = Inches(indent_in)
-
-                            except Exception:
-
-                                pass
+                            p.paragraph_format.left_indent = indent_left
 
                     try:
 
-                        doc.add_paragraph().paragraph_format.space_after = Pt(4)
+                        doc.add_paragraph().paragraph_format.space_after = space_pt4
 
                     except Exception:
 
@@ -11212,21 +12572,15 @@ class ResumeApp(ttk.Frame):
 
                 else:
 
-                    entry_title = str(e.get("title", "")).strip()
+                    entry_title = _s(e.get("title"))
 
                     if entry_title:
 
                         p = doc.add_paragraph()
 
-                        try:
-
-                            p.paragraph_format.left_indent = Inches(indent_in)
-
-                            p.paragraph_format.space_after = Pt(0)
+                        p.paragraph_format.left_indent = indent_left
 
-                        except Exception:
-
-                            pass
+                        p.paragraph_format.space_after = space_pt0
 
                         r = p.add_run(_sanitize_text(entry_title))
 
@@ -11236,23 +12590,15 @@ class ResumeApp(ttk.Frame):
 
                     body = e.get("body", [])
 
-                    body_text = segments_to_plain(body)
-
-                    if body_text:
+                    if _has_any_text(body):
 
                         p = add_rich_paragraph(doc, body)
 
-                        try:
-
-                            p.paragraph_format.left_indent = Inches(indent_in)
-
-                        except Exception:
-
-                            pass
+                        p.paragraph_format.left_indent = indent_left
 
                     try:
 
-                        doc.add_paragraph().paragraph_format.space_after = Pt(4)
+                        doc.add_paragraph().paragraph_format.space_after = space_pt4
 
                     except Exception:
 
@@ -11264,15 +12610,9 @@ class ResumeApp(ttk.Frame):
 
                 p = doc.add_paragraph()
 
-                try:
-
-                    p.paragraph_format.left_indent = Inches(indent_in)
-
-                    p.paragraph_format.space_after = Pt(0)
-
-                except Exception:
+                p.paragraph_format.left_indent = indent_left
 
-                    pass
+                p.paragraph_format.space_after = space_pt0
 
                 first_line = True
 
@@ -11282,13 +12622,11 @@ class ResumeApp(ttk.Frame):
 
                         continue
 
-                    label = str(e.get("label", "")).strip()
+                    label = _s(e.get("label"))
 
                     value = e.get("value", [])
 
-                    value_text = segments_to_plain(value)
-
-                    if not (label or value_text):
+                    if not (label or _has_any_text(value)):
 
                         continue
 
@@ -11318,19 +12656,17 @@ class ResumeApp(ttk.Frame):
 
 
 
-        try:
-
-            doc.save(path)
+        def _do_save() -> None:
 
-        except Exception as e:
+            buf = io.BytesIO()
 
-            messagebox.showerror("Export Failed", str(e))
+            doc.save(buf)
 
-            return
+            _write_file_atomic(path, buf.getvalue())
 
 
 
-        messagebox.showinfo("Exported", f"Wrote {path}")
+        self._submit_export(_do_save, path)
 
 
 
@@ -11372,8 +12708,6 @@ class ResumeApp(ttk.Frame):
 
             from reportlab.lib.pagesizes import letter
 
-            from reportlab.pdfbase.pdfmetrics import stringWidth
-
             from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 
             from reportlab.platypus import (
@@ -11408,239 +12742,87 @@ class ResumeApp(ttk.Frame):
 
 
 
-        def _sanitize_text(t: Any) -> str:
-
-            s = "" if t is None else str(t)
-
-            try:
-
-                return s.encode("cp1252", errors="replace").decode("cp1252")
-
-            except Exception:
-
-                return s
-
-
-
-        def _nbsp(s: str) -> str:
-
-            return (s or "").replace(" ", "\u00A0")
-
-
-
-        def _map_font_face(face: Any) -> str:
-
-            f = ("" if face is None else str(face)).strip().lower()
-
-            if not f:
-
-                return "Times-Roman"
-
-            if "courier" in f or "mono" in f:
-
-                return "Courier"
-
-            if "arial" in f or "helvetica" in f or "sans" in f:
-
-                return "Helvetica"
-
-            if "times" in f or "serif" in f or "georgia" in f:
-
-                return "Times-Roman"
-
-            return "Times-Roman"
-
-
-
-        def _map_font_variant(base: str, *, bold: bool, italic: bool) -> str:
-
-            b = bool(bold)
-
-            i = bool(italic)
-
-            if base.startswith("Times"):
-
-                if b and i:
-
-                    return "Times-BoldItalic"
-
-                if b:
-
-                    return "Times-Bold"
-
-                if i:
-
-                    return "Times-Italic"
-
-                return "Times-Roman"
+        def segments_to_markup(segments: Any) -> Tuple[str, Optional[str]]:
 
-            if base.startswith("Helvetica"):
+            # Returns (markup, shared bg color or None); tracking the common
 
-                if b and i:
+            # background here saves segments_to_paragraph a second full pass.
 
-                    return "Helvetica-BoldOblique"
-
-                if b:
-
-                    return "Helvetica-Bold"
-
-                if i:
-
-                    return "Helvetica-Oblique"
-
-                return "Helvetica"
-
-            if base.startswith("Courier"):
-
-                if b and i:
-
-                    return "Courier-BoldOblique"
-
-                if b:
-
-                    return "Courier-Bold"
-
-                if i:
-
-                    return "Courier-Oblique"
-
-                return "Courier"
-
-            return base
-
-
-
-        def _normalize_color(c: Any) -> Optional[str]:
-
-            s = ("" if c is None else str(c)).strip()
-
-            if not s:
-
-                return None
-
-            if re.fullmatch(r"#?[0-9a-fA-F]{6}", s):
-
-                return ("#" + s.lstrip("#")).lower()
-
-            return s
-
-
-
-        def _to_rl_color(c: Any):
-
-            s = _normalize_color(c)
-
-            if not s:
-
-                return None
-
-            try:
-
-                return colors.toColor(s)
-
-            except Exception:
-
-                try:
-
-                    if isinstance(s, str) and s.startswith("#") and len(s) == 7:
-
-                        return colors.HexColor(s)
-
-                except Exception:
+            if segments is None:
 
-                    pass
+                return "", None
 
-            return None
+            if isinstance(segments, str):
 
+                return escape(_sanitize_text(segments)).replace("\n", "<br/>"), None
 
+            if not isinstance(segments, list):
 
-        def _common_bg(segments: Any) -> Optional[str]:
+                return "", None
 
-            if not isinstance(segments, list) or not segments:
+            out: List[str] = []
 
-                return None
+            bg_seen = False
 
-            bg: Optional[str] = None
+            bg_conflict = False
 
-            saw = False
+            bg_common: Optional[str] = None
 
             for seg in segments:
 
-                if not isinstance(seg, dict):
-
-                    continue
-
-                c = _normalize_color(seg.get("bg"))
-
-                if c is None:
-
-                    continue
-
-                if not saw:
-
-                    bg = c
-
-                    saw = True
-
-                elif c != bg:
-
-                    return None
-
-            return bg if saw else None
-
-
-
-        def segments_to_markup(segments: Any) -> str:
+                if isinstance(seg, dict):
 
-            if segments is None:
+                    get = seg.get
 
-                return ""
+                    seg_bg = _normalize_color(get("bg"))
 
-            if isinstance(segments, str):
+                    if seg_bg is not None and not bg_conflict:
 
-                return escape(_sanitize_text(segments)).replace("\n", "<br/>")
+                        if not bg_seen:
 
-            if not isinstance(segments, list):
+                            bg_common = seg_bg
 
-                return ""
+                            bg_seen = True
 
-            out: List[str] = []
+                        elif seg_bg != bg_common:
 
-            for seg in segments:
+                            bg_common = None
 
-                if isinstance(seg, dict):
+                            bg_conflict = True
 
-                    raw = seg.get("text", "")
+                    raw = get("text", "")
 
                     if not isinstance(raw, str) or raw == "":
 
                         continue
 
-                    t = escape(_sanitize_text(raw)).replace("\n", "<br/>")
 
 
+                    is_b = bool(get("b"))
 
-                    font_attrs: List[str] = []
+                    is_i = bool(get("i"))
 
-                    face = seg.get("font")
+                    is_u = bool(get("u"))
 
-                    if face:
+                    font_attrs: List[str] = []
 
-                        is_b = bool(seg.get("b"))
+                    face = get("font")
 
-                        is_i = bool(seg.get("i"))
+                    if face:
 
                         mapped = _map_font_variant(_map_font_face(face), bold=is_b, italic=is_i)
 
-                        font_attrs.append(f" face=\"{escape(mapped)}\"")
+                        # Mapped faces come from _PDF_FACE_TABLE and are plain
+
+                        # ASCII, so the attribute needs no escaping.
 
-                        seg = dict(seg)
+                        font_attrs.append(_font_face_attr(mapped))
 
-                        seg["b"] = False
+                        is_b = False
 
-                        seg["i"] = False
+                        is_i = False
 
-                    size = seg.get("size")
+                    size = get("size")
 
                     if size is not None:
 
@@ -11656,60 +12838,74 @@ class ResumeApp(ttk.Frame):
 
                             font_attrs.append(f" size=\"{s_int}\"")
 
-                    fg = _normalize_color(seg.get("fg"))
+                    fg = _normalize_color(get("fg"))
 
                     if fg:
 
-                        font_attrs.append(f" color=\"{escape(fg)}\"")
+                        font_attrs.append(f" color=\"{fg}\"" if fg.startswith("#") else f" color=\"{escape(fg)}\"")
 
 
 
-                    bg = _normalize_color(seg.get("bg"))
+                    if seg_bg and _to_rl_color(seg_bg) is not None:
 
-                    if bg and _to_rl_color(bg) is not None:
+                        font_attrs.append(f" backcolor=\"{seg_bg}\"" if seg_bg.startswith("#") else f" backcolor=\"{escape(seg_bg)}\"")
 
-                        font_attrs.append(f" backcolor=\"{escape(bg)}\"")
 
 
+                    if font_attrs:
 
-                    if seg.get("u"):
+                        out.append("<font")
 
-                        t = f"<u>{t}</u>"
+                        out.extend(font_attrs)
 
-                    if seg.get("i"):
+                        out.append(">")
 
-                        t = f"<i>{t}</i>"
+                    if is_b:
 
-                    if seg.get("b"):
+                        out.append("<b>")
 
-                        t = f"<b>{t}</b>"
+                    if is_i:
 
+                        out.append("<i>")
 
+                    if is_u:
 
-                    if font_attrs:
+                        out.append("<u>")
+
+                    out.append(escape(_sanitize_text(raw)).replace("\n", "<br/>"))
+
+                    if is_u:
+
+                        out.append("</u>")
+
+                    if is_i:
 
-                        t = f"<font{''.join(font_attrs)}>{t}</font>"
+                        out.append("</i>")
 
-                    out.append(t)
+                    if is_b:
+
+                        out.append("</b>")
+
+                    if font_attrs:
+
+                        out.append("</font>")
 
                 elif isinstance(seg, str) and seg:
 
                     out.append(escape(_sanitize_text(seg)).replace("\n", "<br/>"))
 
-            return "".join(out)
+            return "".join(out), bg_common
 
 
 
         def segments_to_paragraph(segments: Any, style: ParagraphStyle, *, bullet_text: Optional[str] = None):
 
-            markup = segments_to_markup(segments)
+            markup, bg = segments_to_markup(segments)
 
             if not markup:
 
                 return None
 
-            bg = _common_bg(segments)
-
             bg_color = _to_rl_color(bg) if bg else None
 
             st = style
@@ -11720,29 +12916,35 @@ class ResumeApp(ttk.Frame):
 
             if bullet_text is None:
 
-                return Paragraph(markup, st)
+                return _mk_paragraph(markup, st)
 
-            return Paragraph(markup, st, bulletText=bullet_text)
+            if "<" not in markup:
 
+                # Plain text never re-parses differently; cache bulleted
 
+                # paragraphs too so repeated simple bullets skip the parser.
 
-        def _strip_bullet_prefix(segments: Any) -> Any:
+                key = (markup, id(st), bullet_text)
 
-            prefixes = ("- ", "– ", "— ", "• ", "* ")
+                cached = _paragraph_cache.get(key)
 
+                if cached is None:
 
+                    cached = Paragraph(markup, st, bulletText=bullet_text)
 
-            if isinstance(segments, str):
+                    _paragraph_cache[key] = cached
 
-                s = segments.lstrip()
+                return copy.copy(cached)
+
+            return Paragraph(markup, st, bulletText=bullet_text)
 
-                for p in prefixes:
 
-                    if s.startswith(p):
 
-                        return s[len(p) :].lstrip()
+        def _strip_bullet_prefix(segments: Any) -> Any:
+
+            if isinstance(segments, str):
 
-                return s
+                return _BULLET_PREFIX_RE.sub("", segments.lstrip(), count=1)
 
 
 
@@ -11764,19 +12966,9 @@ class ResumeApp(ttk.Frame):
 
                     if isinstance(t, str) and t:
 
-                        s = t.lstrip()
-
-                        for p in prefixes:
-
-                            if s.startswith(p):
-
-                                s = s[len(p) :].lstrip()
-
-                                break
-
                         new_seg = dict(seg)
 
-                        new_seg["text"] = s
+                        new_seg["text"] = _BULLET_PREFIX_RE.sub("", t.lstrip(), count=1)
 
                         out.append(new_seg)
 
@@ -11786,17 +12978,7 @@ class ResumeApp(ttk.Frame):
 
                 if not stripped and isinstance(seg, str) and seg:
 
-                    s = seg.lstrip()
-
-                    for p in prefixes:
-
-                        if s.startswith(p):
-
-                            s = s[len(p) :].lstrip()
-
-                            break
-
-                    out.append(s)
+                    out.append(_BULLET_PREFIX_RE.sub("", seg.lstrip(), count=1))
 
                     stripped = True
 
@@ -11956,7 +13138,35 @@ class ResumeApp(ttk.Frame):
 
         bullet_style.bulletFontName = "Helvetica"
 
-        bullet_style.bulletFontSize = 7
+        bullet_style.bulletFontSize = 7
+
+
+
+        _paragraph_cache: Dict[Tuple, Any] = {}
+
+
+
+        def _mk_paragraph(markup: str, style: ParagraphStyle):
+
+            # Building a Paragraph parses its mini-XML; identical markup with
+
+            # the same style (blank cells, repeated dates, "Present") shows up
+
+            # constantly, so reuse the parse. ReportLab mutates flowables
+
+            # during layout, so hand out a shallow copy, never the original.
+
+            key = (markup, id(style))
+
+            cached = _paragraph_cache.get(key)
+
+            if cached is None:
+
+                cached = Paragraph(markup, style)
+
+                _paragraph_cache[key] = cached
+
+            return copy.copy(cached)
 
 
 
@@ -11982,9 +13192,53 @@ class ResumeApp(ttk.Frame):
 
         two_col_right_inset = 6.0
 
+        # One TableStyle shared by every two-column header row; building a
+
+        # fresh style object per row was pure allocation overhead.
+
+        two_col_table_style = TableStyle(
+
+            [
+
+                ("VALIGN", (0, 0), (-1, -1), "TOP"),
+
+                ("ALIGN", (0, 0), (0, 0), "LEFT"),
+
+                ("ALIGN", (1, 0), (1, 0), "RIGHT"),
+
+                ("LEFTPADDING", (0, 0), (-1, -1), 0),
+
+                ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+
+                ("RIGHTPADDING", (1, 0), (1, 0), two_col_right_inset),
+
+                ("TOPPADDING", (0, 0), (-1, -1), 0),
+
+                ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
+
+            ]
+
+        )
+
+
+
+        def _two_col(left_markup: str, right_markup: str, *, italic: bool = False):
+
+            # Paragraph has no real tab-stop support, so the left/right header
+
+            # line stays a one-row Table with a right-aligned second column.
+
+            if italic:
+
+                left = _mk_paragraph(left_markup, entry_left_italic)
 
+                right = _mk_paragraph(right_markup, entry_right_italic)
 
-        def _two_col(left: Paragraph, right: Paragraph):
+            else:
+
+                left = _mk_paragraph(left_markup, base)
+
+                right = _mk_paragraph(right_markup, entry_right)
 
             right_plain = ""
 
@@ -12014,7 +13268,7 @@ class ResumeApp(ttk.Frame):
 
             available_width = max(1, doc.width - float(current_left_indent or 0.0) - float(two_col_right_inset or 0.0))
 
-            w = stringWidth(_sanitize_text(right_plain), right_font, right_size) + 6
+            w = _cached_string_width(_sanitize_text(right_plain), right_font, right_size) + 6
 
             right_w = max(available_width * 0.18, min(available_width * 0.42, w))
 
@@ -12032,33 +13286,7 @@ class ResumeApp(ttk.Frame):
 
             )
 
-            t.setStyle(
-
-                TableStyle(
-
-                    [
-
-                        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-
-                        ("ALIGN", (0, 0), (0, 0), "LEFT"),
-
-                        ("ALIGN", (1, 0), (1, 0), "RIGHT"),
-
-                        ("LEFTPADDING", (0, 0), (-1, -1), 0),
-
-                        ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-
-                        ("RIGHTPADDING", (1, 0), (1, 0), two_col_right_inset),
-
-                        ("TOPPADDING", (0, 0), (-1, -1), 0),
-
-                        ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-
-                    ]
-
-                )
-
-            )
+            t.setStyle(two_col_table_style)
 
             return t
 
@@ -12072,7 +13300,7 @@ class ResumeApp(ttk.Frame):
 
                 return
 
-            story.append(Paragraph(escape(_sanitize_text(t)), section_style))
+            story.append(_mk_paragraph(escape(_sanitize_text(t)), section_style))
 
             story.append(
 
@@ -12110,295 +13338,261 @@ class ResumeApp(ttk.Frame):
 
 
 
-        story: List[Any] = []
-
-
-
-        header = self.data.get("header", {}) if isinstance(self.data.get("header"), dict) else {}
-
-        name = str(header.get("name", "")).strip()
-
-        phone = str(header.get("phone", "")).strip()
-
-        email = str(header.get("email", "")).strip()
-
-        linkedin_kind = str(header.get("linkedin_kind", "LinkedIn") or "").strip()
-
-        github_kind = str(header.get("github_kind", "GitHub") or "").strip()
-
-        linkedin = "" if linkedin_kind.lower() == "none" else str(header.get("linkedin", "")).strip()
-
-        linkedin_display = str(header.get("linkedin_display", "")).strip()
-
-        github = "" if github_kind.lower() == "none" else str(header.get("github", "")).strip()
-
-        github_display = str(header.get("github_display", "")).strip()
-
-
-
-        if name:
-
-            story.append(Paragraph(escape(_sanitize_text(name)), name_style))
-
-
+        def _render_education(e: dict, block: List[Any]) -> None:
 
-        def _is_omit_kind(k: str) -> bool:
+            school_x = escape(_sanitize_text(_s(e.get("school"))))
 
-            return (k or "").strip().lower() == "none"
+            loc_x = escape(_sanitize_text(_nbsp(_s(e.get("location")))))
 
+            degree_x = escape(_sanitize_text(_s(e.get("degree"))))
 
+            dates_x = escape(_sanitize_text(_nbsp(_s(e.get("dates")))))
 
-        def _link_markup(href: str, text: str) -> str:
 
-            href_attr = escape(_sanitize_text(href), {'"': "&quot;"})
 
-            txt = escape(_sanitize_text(text))
+            block.append(_two_col(f"<b>{school_x}</b>", loc_x))
 
-            return f'<link href="{href_attr}"><u>{txt}</u></link>'
+            block.append(_two_col(degree_x, dates_x, italic=True))
 
 
 
-        contact_parts: List[str] = []
+            p = segments_to_paragraph(
 
-        if phone:
+                _strip_bullet_prefix(e.get("body", [])),
 
-            contact_parts.append(escape(_sanitize_text(phone)))
+                bullet_style,
 
-        if email:
+                bullet_text="\u2022",
 
-            contact_parts.append(_link_markup(f"mailto:{email}", email))
+            )
 
-        if not _is_omit_kind(linkedin_kind) and linkedin:
+            if p is not None:
 
-            href = _normalize_href(linkedin)
+                block.append(p)
 
-            contact_parts.append(_link_markup(href, _display_url(href, linkedin_display)))
 
-        if not _is_omit_kind(github_kind) and github:
 
-            href = _normalize_href(github)
+            block.append(Spacer(1, 3))
 
-            contact_parts.append(_link_markup(href, _display_url(href, github_display)))
 
-        if contact_parts:
 
-            story.append(Paragraph(" | ".join(contact_parts), contact_style))
+        def _render_experience(e: dict, block: List[Any]) -> None:
 
-        else:
+            role_x = escape(_sanitize_text(_s(e.get("role"))))
 
-            story.append(Spacer(1, 10))
+            org_x = escape(_sanitize_text(_s(e.get("org"))))
 
+            loc_x = escape(_sanitize_text(_nbsp(_s(e.get("location")))))
 
+            dates_x = escape(_sanitize_text(_nbsp(_s(e.get("dates")))))
 
-        for section in self.data.get("sections", []) or []:
 
-            if not isinstance(section, dict):
 
-                continue
+            block.append(_two_col(f"<b>{role_x}</b>", dates_x))
 
-            title = str(section.get("title", "")).strip()
+            block.append(_two_col(org_x, loc_x, italic=True))
 
-            kind = str(section.get("kind", "") or "").strip().lower()
+            _add_bullets_to(block, e.get("bullets", []))
 
-            raw_entries = section.get("entries", []) or []
+            block.append(Spacer(1, 4))
 
-            entries = raw_entries if isinstance(raw_entries, list) else []
 
 
+        def _render_projects(e: dict, block: List[Any]) -> None:
 
-            if title:
+            stack = _s(e.get("stack"))
 
-                _add_section_header(story, title)
 
 
+            left = f"<b>{escape(_sanitize_text(_s(e.get('title'))))}</b>"
 
-            indent_started = False
+            if stack:
 
-            if kind in ("education", "experience", "projects", "skills"):
+                left += f" | <i>{escape(_sanitize_text(stack))}</i>"
 
-                story.append(Indenter(left=10.8, right=0))
 
-                indent_started = True
 
-                current_left_indent = 10.8
+            dates_x = escape(_sanitize_text(_nbsp(_s(e.get("dates")))))
 
+            block.append(_two_col(left, dates_x))
 
+            _add_bullets_to(block, e.get("bullets", []))
 
-            for e in entries:
+            block.append(Spacer(1, 4))
 
-                if not isinstance(e, dict):
 
-                    continue
 
+        def _render_custom(e: dict, block: List[Any]) -> None:
 
+            entry_title = _s(e.get("title"))
 
-                block: List[Any] = []
+            if entry_title:
 
+                block.append(_mk_paragraph(escape(_sanitize_text(entry_title)), entry_left_bold))
 
+            p = segments_to_paragraph(e.get("body", []), base)
 
-                if kind == "education":
+            if p is not None:
 
-                    school = str(e.get("school", "")).strip()
+                block.append(p)
 
-                    location = str(e.get("location", "")).strip()
+            block.append(Spacer(1, 4))
 
-                    degree = str(e.get("degree", "")).strip()
 
-                    dates = str(e.get("dates", "")).strip()
 
+        entry_renderers = {
 
+            "education": _render_education,
 
-                    block.append(
+            "experience": _render_experience,
 
-                        _two_col(
+            "projects": _render_projects,
 
-                            Paragraph(escape(_sanitize_text(school)), entry_left_bold),
+        }
 
-                            Paragraph(escape(_sanitize_text(_nbsp(location))), entry_right),
 
-                        )
 
-                    )
+        story: List[Any] = []
 
-                    block.append(
 
-                        _two_col(
 
-                            Paragraph(escape(_sanitize_text(degree)), entry_left_italic),
+        header = self.data.get("header", {}) if isinstance(self.data.get("header"), dict) else {}
 
-                            Paragraph(escape(_sanitize_text(_nbsp(dates))), entry_right_italic),
+        name = _s(header.get("name"))
 
-                        )
+        phone = _s(header.get("phone"))
 
-                    )
+        email = _s(header.get("email"))
 
+        linkedin_kind = str(header.get("linkedin_kind", "LinkedIn") or "").strip()
 
+        github_kind = str(header.get("github_kind", "GitHub") or "").strip()
 
-                    p = segments_to_paragraph(
+        linkedin = "" if linkedin_kind.lower() == "none" else _s(header.get("linkedin"))
 
-                        _strip_bullet_prefix(e.get("body", [])),
+        linkedin_display = _s(header.get("linkedin_display"))
 
-                        bullet_style,
+        github = "" if github_kind.lower() == "none" else _s(header.get("github"))
 
-                        bullet_text="\u2022",
+        github_display = _s(header.get("github_display"))
 
-                    )
 
-                    if p is not None:
 
-                        block.append(p)
+        if name:
 
+            story.append(_mk_paragraph(escape(_sanitize_text(name)), name_style))
 
 
-                    block.append(Spacer(1, 3))
 
+        def _is_omit_kind(k: str) -> bool:
 
+            return (k or "").strip().lower() == "none"
 
-                elif kind == "experience":
 
-                    role = str(e.get("role", "")).strip()
 
-                    org = str(e.get("org", "")).strip()
+        def _link_markup(href: str, text: str) -> str:
 
-                    location = str(e.get("location", "")).strip()
+            href_attr = escape(_sanitize_text(href), {'"': "&quot;"})
 
-                    dates = str(e.get("dates", "")).strip()
+            txt = escape(_sanitize_text(text))
 
+            return f'<link href="{href_attr}"><u>{txt}</u></link>'
 
 
-                    block.append(
 
-                        _two_col(
+        contact_parts: List[str] = []
 
-                            Paragraph(escape(_sanitize_text(role)), entry_left_bold),
+        if phone:
 
-                            Paragraph(escape(_sanitize_text(_nbsp(dates))), entry_right),
+            contact_parts.append(escape(_sanitize_text(phone)))
 
-                        )
+        if email:
 
-                    )
+            contact_parts.append(_link_markup(f"mailto:{email}", email))
 
-                    block.append(
+        if not _is_omit_kind(linkedin_kind) and linkedin:
 
-                        _two_col(
+            href = _normalize_href(linkedin)
 
-                            Paragraph(escape(_sanitize_text(org)), entry_left_italic),
+            contact_parts.append(_link_markup(href, _display_url(href, linkedin_display)))
 
-                            Paragraph(escape(_sanitize_text(_nbsp(location))), entry_right_italic),
+        if not _is_omit_kind(github_kind) and github:
 
-                        )
+            href = _normalize_href(github)
 
-                    )
+            contact_parts.append(_link_markup(href, _display_url(href, github_display)))
 
-                    _add_bullets_to(block, e.get("bullets", []))
+        if contact_parts:
 
-                    block.append(Spacer(1, 4))
+            story.append(Paragraph(" | ".join(contact_parts), contact_style))
 
+        else:
 
+            story.append(Spacer(1, 10))
 
-                elif kind == "projects":
 
-                    proj_title = str(e.get("title", "")).strip()
 
-                    stack = str(e.get("stack", "")).strip()
+        sections = self.data.get("sections") or []
 
-                    dates = str(e.get("dates", "")).strip()
+        for section in sections:
 
+            if not isinstance(section, dict):
 
+                continue
 
-                    left = f"<b>{escape(_sanitize_text(proj_title))}</b>"
+            get = section.get
 
-                    if stack:
+            title = _s(get("title"))
 
-                        left += f" | <i>{escape(_sanitize_text(stack))}</i>"
+            kind = _s(get("kind")).lower()
 
+            raw_entries = get("entries") or []
 
+            entries = raw_entries if isinstance(raw_entries, list) else []
 
-                    block.append(
 
-                        _two_col(
 
-                            Paragraph(left, base),
+            if title:
 
-                            Paragraph(escape(_sanitize_text(_nbsp(dates))), entry_right),
+                _add_section_header(story, title)
 
-                        )
 
-                    )
 
-                    _add_bullets_to(block, e.get("bullets", []))
+            indent_started = False
 
-                    block.append(Spacer(1, 4))
+            if kind in ("education", "experience", "projects", "skills"):
 
+                story.append(Indenter(left=10.8, right=0))
 
+                indent_started = True
 
-                elif kind == "skills":
+                current_left_indent = 10.8
 
-                    break
 
 
+            # kind is loop-invariant: pick the renderer once per section
 
-                else:
+            # instead of re-branching for every entry.
 
-                    entry_title = str(e.get("title", "")).strip()
+            if kind != "skills":
 
-                    if entry_title:
+                renderer = entry_renderers.get(kind, _render_custom)
 
-                        block.append(Paragraph(escape(_sanitize_text(entry_title)), entry_left_bold))
+                for e in entries:
 
-                    p = segments_to_paragraph(e.get("body", []), base)
+                    if not isinstance(e, dict):
 
-                    if p is not None:
+                        continue
 
-                        block.append(p)
 
-                    block.append(Spacer(1, 4))
 
+                    block: List[Any] = []
 
+                    renderer(e, block)
 
-                if block:
+                    if block:
 
-                    story.extend(block)
+                        story.extend(block)
 
 
 
@@ -12412,9 +13606,9 @@ class ResumeApp(ttk.Frame):
 
                         continue
 
-                    label = str(e.get("label", "")).strip()
+                    label = _s(e.get("label"))
 
-                    value_markup = segments_to_markup(e.get("value", []))
+                    value_markup, _ = segments_to_markup(e.get("value", []))
 
                     label_txt = escape(_sanitize_text(label))
 
@@ -12444,19 +13638,7 @@ class ResumeApp(ttk.Frame):
 
 
 
-        try:
-
-            doc.build(story)
-
-        except Exception as e:
-
-            messagebox.showerror("Export Failed", str(e))
-
-            return
-
-
-
-        messagebox.showinfo("Exported", f"Wrote {path}")
+        self._submit_export(lambda: doc.build(story), path)
 
 
 
@@ -12486,11 +13668,11 @@ class ResumeApp(ttk.Frame):
 
             return
 
-        self._checkpoint_before_change()
+        with self._batch():
 
-        self._apply_state(DEFAULT_DATA)
+            self._apply_state(DEFAULT_DATA)
 
-        self._update_undo_redo_buttons()
+        self._schedule_ui_sync()
 
 
 
@@ -12508,11 +13690,11 @@ class ResumeApp(ttk.Frame):
 
             return
 
-        self._checkpoint_before_change()
+        with self._batch():
 
-        self._apply_state(DEMO_DATA)
+            self._apply_state(DEMO_DATA)
 
-        self._update_undo_redo_buttons()
+        self._schedule_ui_sync()
 
 
 
@@ -12680,7 +13862,7 @@ class ResumeApp(ttk.Frame):
 
         self.refresh_sections()
 
-        self._update_undo_redo_buttons()
+        self._schedule_ui_sync()
 
 
 
@@ -12692,7 +13874,9 @@ class ResumeApp(ttk.Frame):
 
             return
 
-        sec = self.data.get("sections", [])[idx]
+        sections = self.data.setdefault("sections", [])
+
+        sec = sections[idx]
 
         new_title = _ask_string_centered(
 
@@ -12710,17 +13894,19 @@ class ResumeApp(ttk.Frame):
 
             return
 
-        self._checkpoint_before_change()
+        if new_title.strip() == sec.get("title", ""):
 
-        sec["title"] = new_title.strip()
+            return
 
-        self.refresh_sections()
+        self._checkpoint_before_change(path=("sections", idx))
 
-        self.sections_tree.selection_set(str(idx))
+        sec["title"] = new_title.strip()
 
-        self.on_section_selected(None)
+        # Retitle the one affected row; selection and entries are untouched.
 
-        self._update_undo_redo_buttons()
+        self.sections_tree.item(str(idx), values=(sec.get("title", ""), sec.get("kind", "")))
+
+        self._schedule_ui_sync()
 
 
 
@@ -12732,57 +13918,77 @@ class ResumeApp(ttk.Frame):
 
             return
 
-        sec = self.data.get("sections", [])[idx]
+        sections = self.data.setdefault("sections", [])
 
-        ok = messagebox.askyesno("Delete Section", f"Delete section '{sec.get('title','')}'?")
+        sec = sections[idx]
 
-        if not ok:
+        title = sec.get("title", "")
 
-            return
+        self._checkpoint_before_change(path=("sections",))
 
-        self._checkpoint_before_change()
+        sections.pop(idx)
 
-        self.data.get("sections", []).pop(idx)
+        # Positional iids: drop the last row and shift the rest up in place.
 
-        self.refresh_sections()
+        last = len(sections)
 
-        self._update_undo_redo_buttons()
+        self.sections_tree.delete(str(last))
 
+        for i in range(idx, last):
 
+            sec_i = sections[i]
 
-    def add_entry(self):
+            self.sections_tree.item(str(i), values=(sec_i.get("title", ""), sec_i.get("kind", "")))
 
-        sidx = self._selected_section_index()
+        if sections:
 
-        if sidx < 0:
+            if self.sections_tree.selection():
 
-            return
+                # The selected iid survived the shift, so no
 
-        sec = self.data.get("sections", [])[sidx]
+                # <<TreeviewSelect>> fires; refresh entries for the row's
 
-        kind = sec.get("kind")
+                # new occupant directly.
 
-        new_entry = {}
+                self.on_section_selected(None)
 
-        if kind == "education":
+            else:
+
+                self.sections_tree.selection_set(str(min(idx, last - 1)))
 
-            new_entry = {"school": "", "location": "", "degree": "", "dates": ""}
+        else:
+
+            for iid in self.entries_tree.get_children(""):
+
+                self.entries_tree.delete(iid)
 
-        elif kind == "experience":
+            self._update_entry_action_buttons()
 
-            new_entry = {"role": "", "dates": "", "org": "", "location": "", "bullets": [[{"text": ""}]]}
+        self._schedule_ui_sync()
 
-        elif kind == "projects":
+        self._show_toast(f"Deleted '{title}' — Ctrl+Z to undo")
 
-            new_entry = {"title": "", "stack": "", "dates": "", "bullets": [[{"text": ""}]]}
 
-        elif kind == "skills":
 
-            new_entry = {"label": "", "value": [{"text": ""}]}
+    def add_entry(self):
 
-        else:
+        sidx = self._selected_section_index()
+
+        if sidx < 0:
+
+            return
+
+        sections = self.data.setdefault("sections", [])
+
+        sec = sections[sidx]
+
+        kind = sec.get("kind")
+
+        new_entry = deep_copy(
 
-            new_entry = {"title": "", "body": [{"text": ""}]}
+            _EMPTY_ENTRY_TEMPLATES.get(kind, _EMPTY_ENTRY_TEMPLATES["_default"])
+
+        )
 
 
 
@@ -12798,51 +14004,51 @@ class ResumeApp(ttk.Frame):
 
 
 
-        dlg = EntryEditorDialog(self, kind, new_entry, on_change=_draft)
+        def _done(result: Optional[dict]) -> None:
 
-        self.wait_window(dlg)
+            try:
 
+                if result is None or result == new_entry:
 
+                    return
 
-        try:
+                self._checkpoint_before_change(path=("sections", sidx, "entries"))
 
-            if dlg.result is None:
+                entries.append(result)
 
-                return
+                # One row changed; insert it instead of rebuilding the tree.
 
-            self._checkpoint_before_change()
+                self.entries_tree.insert(
 
-            entries.append(dlg.result)
+                    "", "end", iid=str(draft_eidx), values=(self._entry_summary(kind, result),)
 
-            self.refresh_entries()
+                )
 
-            self._update_undo_redo_buttons()
+                if not self.entries_tree.selection():
 
-        finally:
+                    self.entries_tree.selection_set("0")
 
-            self._clear_session_draft_entry()
+                self._update_entry_action_buttons()
 
+                self._schedule_ui_sync()
 
+            finally:
 
-    def edit_entry(self):
+                self._clear_session_draft_entry()
 
-        sidx = self._selected_section_index()
 
-        eidx = self._selected_entry_index()
 
-        if sidx < 0 or eidx < 0:
+        # Completion arrives through on_done; no nested wait_window loop.
 
-            return
+        EntryEditorDialog(self, kind, new_entry, on_change=_draft, on_done=_done)
 
-        sec = self.data.get("sections", [])[sidx]
 
-        kind = sec.get("kind")
 
-        entries = sec.get("entries", [])
+    @_with_selected_entry
 
-        if eidx >= len(entries):
+    def edit_entry(self, sidx, sec, entries, eidx):
 
-            return
+        kind = sec.get("kind")
 
 
 
@@ -12852,65 +14058,63 @@ class ResumeApp(ttk.Frame):
 
 
 
-        dlg = EntryEditorDialog(self, kind, entries[eidx], on_change=_draft)
-
-        self.wait_window(dlg)
+        def _done(result: Optional[dict]) -> None:
 
+            try:
 
+                if result is None or result == entries[eidx]:
 
-        try:
+                    return
 
-            if dlg.result is None:
+                self._checkpoint_before_change(path=("sections", sidx, "entries"))
 
-                return
+                entries[eidx] = result
 
-            self._checkpoint_before_change()
+                self.entries_tree.item(str(eidx), values=(self._entry_summary(kind, result),))
 
-            entries[eidx] = dlg.result
+                self._update_entry_action_buttons()
 
-            self.refresh_entries()
+                self._schedule_ui_sync()
 
-            self.entries_tree.selection_set(str(eidx))
+            finally:
 
-            self._update_undo_redo_buttons()
+                self._clear_session_draft_entry()
 
-        finally:
 
-            self._clear_session_draft_entry()
 
+        # Completion arrives through on_done; no nested wait_window loop.
 
+        EntryEditorDialog(self, kind, entries[eidx], on_change=_draft, on_done=_done)
 
-    def delete_entry(self):
 
-        sidx = self._selected_section_index()
 
-        eidx = self._selected_entry_index()
+    @_with_selected_entry
 
-        if sidx < 0 or eidx < 0:
+    def delete_entry(self, sidx, sec, entries, eidx):
 
-            return
+        self._checkpoint_before_change(path=("sections", sidx, "entries"))
 
-        sec = self.data.get("sections", [])[sidx]
+        entries.pop(eidx)
 
-        entries = sec.get("entries", [])
+        # Drop the last positional iid and shift the remaining summaries up
 
-        if eidx >= len(entries):
+        # in place, mirroring how drag-drop rewrites affected rows.
 
-            return
+        last = len(entries)
 
-        ok = messagebox.askyesno("Delete Entry", "Delete selected entry?")
+        self.entries_tree.delete(str(last))
 
-        if not ok:
+        self._rewrite_entry_rows(sec.get("kind"), entries, eidx, last)
 
-            return
+        if entries and not self.entries_tree.selection():
 
-        self._checkpoint_before_change()
+            self.entries_tree.selection_set("0")
 
-        entries.pop(eidx)
+        self._update_entry_action_buttons()
 
-        self.refresh_entries()
+        self._schedule_ui_sync()
 
-        self._update_undo_redo_buttons()
+        self._show_toast("Deleted entry — Ctrl+Z to undo")
 
 
 
@@ -0,0 +1,54 @@
+import importlib.util
+import os
+import sys
+import tempfile
+import unittest
+
+try:
+    import docx
+except Exception:
+    docx = None
+
+_APP_PATH = os.path.join(os.path.dirname(__file__), "..", "JakeGResumeBuilder_GUI_v.1.0.2.py")
+
+
+def _load_app_module():
+    spec = importlib.util.spec_from_file_location("resume_builder_app", _APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@unittest.skipIf(docx is None, "python-docx not installed")
+class DocxExportSmokeTest(unittest.TestCase):
+    def test_demo_data_exports_valid_document(self):
+        module = _load_app_module()
+        out_path = os.path.join(tempfile.mkdtemp(), "resume.docx")
+        module.filedialog.asksaveasfilename = lambda **kwargs: out_path
+
+        class StubApp:
+            data = module.DEMO_DATA
+
+            def _commit_header_typing(self):
+                pass
+
+            def sync_header_from_ui(self):
+                pass
+
+            def _submit_export(self, fn, path):
+                fn()
+
+        module.ResumeApp.export_as_docx(StubApp())
+
+        document = docx.Document(out_path)
+        self.assertGreater(len(document.paragraphs), 0)
+        self.assertGreater(len(document.tables), 0)
+
+        # The body schema allows nothing after w:sectPr; cloned two-column
+        # tables must land at the cursor, not trail the section properties.
+        child_tags = [child.tag.rsplit("}", 1)[-1] for child in document.element.body]
+        self.assertEqual(child_tags[-1], "sectPr")
+
+
+if __name__ == "__main__":
+    unittest.main()